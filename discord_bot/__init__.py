@@ -1,7 +1,18 @@
 """Discord bot package for House Duties Scheduler."""
+import importlib
 
 __version__ = "1.0.0"
 
-from .bot import bot, run_bot
-
 __all__ = ["bot", "run_bot"]
+
+
+def __getattr__(name):
+    # Import the bot lazily so that the pure helpers (e.g. discord_bot.scheduler)
+    # can be used without importing discord.py or requiring bot configuration.
+    if name in __all__:
+        bot_module = importlib.import_module(f"{__name__}.bot")
+        # Importing the submodule binds discord_bot.bot to the module;
+        # rebind the public names to the Bot instance and run_bot function.
+        globals().update(bot=bot_module.bot, run_bot=bot_module.run_bot)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
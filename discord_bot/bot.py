@@ -1,12 +1,22 @@
 """Main Discord bot implementation with task scheduling."""
+import asyncio
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 import discord
-from discord.ext import commands, tasks
-from datetime import datetime, time as dt_time
+from discord.ext import commands
+from datetime import datetime, timezone
+from typing import Optional
 
 from .config import BotConfig, COLOR_ERROR, COLOR_WARNING, COLOR_INFO
-from .commands import setup_commands, send_schedule_embeds
-from .scheduler import run_scheduler_with_retry
+from .commands import setup_commands, post_schedule
+from .scheduler import run_scheduler_with_retry, next_sunday_run
 from .embeds import create_status_embed, create_error_embed
+from .send_queue import send_queue
+
+logger = logging.getLogger(__name__)
 
 
 # Create bot instance
@@ -15,17 +25,32 @@ intents.message_content = True
 bot = commands.Bot(command_prefix='!', intents=intents)
 
 # Load configuration
-config = BotConfig()
+config = BotConfig.from_env()
+
+# Background task posting the weekly schedule (started once in on_ready)
+_weekly_task: Optional[asyncio.Task] = None
+
+# Channel the weekly schedule is posted to (resolved in on_ready, or on
+# the next run if it wasn't available then)
+_schedule_channel: Optional[discord.abc.Messageable] = None
 
 
 @bot.event
 async def on_ready():
     """Called when bot successfully connects to Discord."""
-    print(f'🤖 {bot.user} is now online!')
-    print(f'📅 Scheduled to run every Sunday at {config.RUN_TIME_HOUR:02d}:{config.RUN_TIME_MINUTE:02d}')
-    print(f'💬 Command prefix: !')
-    print(f'📝 Available commands: run-schedule, my-chores, chores-today, ping')
-    weekly_scheduler.start()
+    logger.info(f'🤖 {bot.user} is now online!')
+    logger.info(f'📅 Scheduled to run every Sunday at {config.RUN_TIME_HOUR:02d}:{config.RUN_TIME_MINUTE:02d} UTC')
+    logger.info(f'💬 Command prefix: !')
+    logger.info(f'📝 Available commands: run-schedule, my-chores, chores-today, ping')
+    
+    global _schedule_channel, _weekly_task
+    _schedule_channel = bot.get_channel(config.CHANNEL_ID)
+    if _schedule_channel is None:
+        logger.warning(f"⚠️ Channel {config.CHANNEL_ID} not in cache yet; will look it up again before posting")
+    
+    # on_ready fires again after reconnects; keep a single scheduler task
+    if _weekly_task is None or _weekly_task.done():
+        _weekly_task = asyncio.create_task(weekly_scheduler())
 
 
 @bot.event
@@ -37,51 +62,78 @@ async def on_command_error(ctx, error):
             "You don't have permission to use this command.",
             "error"
         )
-        await ctx.send(embed=embed)
+        await send_queue.send(ctx, embed=embed)
     elif isinstance(error, commands.CommandNotFound):
         embed = create_status_embed(
             "❓ Command Not Found",
             f"Use `!help` to see available commands.",
             "warning"
         )
-        await ctx.send(embed=embed)
+        await send_queue.send(ctx, embed=embed)
     elif isinstance(error, commands.MissingRequiredArgument):
         embed = create_status_embed(
             "⚠️ Missing Argument",
             f"Missing required argument: `{error.param.name}`\nUse `!help {ctx.command}` for usage.",
             "warning"
         )
-        await ctx.send(embed=embed)
+        await send_queue.send(ctx, embed=embed)
     else:
         # Log unexpected errors
-        print(f"❌ Unexpected error in {ctx.command}: {error}")
+        logger.error(f"❌ Unexpected error in {ctx.command}: {error}")
         embed = create_status_embed(
             "❌ Error",
             f"An unexpected error occurred: {str(error)}",
             "error"
         )
-        await ctx.send(embed=embed)
+        await send_queue.send(ctx, embed=embed)
 
 
-@tasks.loop(time=dt_time(hour=config.RUN_TIME_HOUR, minute=config.RUN_TIME_MINUTE))
 async def weekly_scheduler():
-    """Runs every day at the specified time, but only executes on Sundays."""
-    now = datetime.now()
-    
-    # Only run on Sundays (weekday 6)
-    if now.weekday() != 6:
-        print(f"⏭️  Skipping - today is {now.strftime('%A')} (not Sunday)")
-        return
-    
-    print(f"📅 Sunday detected - running house duties scheduler")
+    """Sleep until each Sunday at the configured time, then post the schedule."""
+    last_run = None
+    while True:
+        # RUN_TIME_* are UTC, as with the tasks.loop(time=...) this replaced
+        now = datetime.now(timezone.utc)
+        # Measure from the last target too, so an early wakeup can't rerun it
+        target = next_sunday_run(
+            config.RUN_TIME_HOUR,
+            config.RUN_TIME_MINUTE,
+            max(now, last_run) if last_run else now
+        )
+        logger.info(f"⏰ Next scheduled run: {target:%A %Y-%m-%d %H:%M} UTC")
+        await asyncio.sleep((target - now).total_seconds())
+        last_run = target
+        
+        try:
+            await run_weekly_schedule()
+        except Exception as e:
+            logger.exception(f"❌ Weekly schedule run failed: {e}")
+
+
+async def get_schedule_channel() -> Optional[discord.abc.Messageable]:
+    """Return the schedule channel, retrying the cache and then the API if on_ready missed it."""
+    global _schedule_channel
+    if _schedule_channel is None:
+        _schedule_channel = bot.get_channel(config.CHANNEL_ID)
+    if _schedule_channel is None:
+        try:
+            _schedule_channel = await bot.fetch_channel(config.CHANNEL_ID)
+        except (discord.HTTPException, discord.InvalidData) as e:
+            logger.warning(f"⚠️ Could not fetch channel {config.CHANNEL_ID}: {e}")
+    return _schedule_channel
+
+
+async def run_weekly_schedule():
+    """Generate this week's schedule and post it to the configured channel."""
+    logger.info("📅 Sunday - running house duties scheduler")
     
-    channel = bot.get_channel(config.CHANNEL_ID)
-    if not channel:
-        print(f"❌ Could not find channel with ID {config.CHANNEL_ID}")
+    channel = await get_schedule_channel()
+    if channel is None:
+        logger.error(f"❌ Could not find channel with ID {config.CHANNEL_ID}")
         return
     
     # Send "generating" message
-    status_msg = await channel.send(embed=create_status_embed(
+    status_msg = await send_queue.send(channel, embed=create_status_embed(
         "🔄 Generating Schedule",
         "Please wait while the schedule is being generated...",
         "info"
@@ -92,35 +144,58 @@ async def weekly_scheduler():
         config.PYTHON_CMD,
         config.SCRIPT_PATH,
         config.MAX_RETRIES,
-        config.RETRY_DELAY
+        config.RETRY_DELAY,
+        config.RUN_IN_PROCESS
     )
     
     if success and schedule_data:
-        # Delete status message
-        await status_msg.delete()
-        
-        # Send schedule with embeds
-        await send_schedule_embeds(channel, schedule_data)
-        print("✅ Schedule posted to Discord successfully!")
+        # Replace status message with the schedule embeds
+        if await post_schedule(channel, schedule_data, status_msg):
+            logger.info("✅ Schedule posted to Discord successfully!")
+        else:
+            logger.info("ℹ️ Schedule unchanged since last post - skipped")
     else:
         # Update status message with error
         await status_msg.edit(embed=create_error_embed(error, config.MAX_RETRIES))
 
 
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send bot (and in-process scheduler) log records to stdout.
+    
+    Records are queued and written by a background listener thread, so
+    logging from the event loop never waits on the stdout write.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on exit
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+
 def run_bot():
     """Start the Discord bot."""
+    configure_logging()
+    
     # Register commands
     setup_commands(bot, config)
     
-    # Print startup info
-    print("🚀 Starting Discord bot...")
-    print(f"📋 Configuration:")
-    print(f"   Channel ID: {config.CHANNEL_ID}")
-    print(f"   Run Time: {config.RUN_TIME_HOUR:02d}:{config.RUN_TIME_MINUTE:02d}")
-    print(f"   Script: {config.SCRIPT_PATH}")
-    print(f"   Python: {config.PYTHON_CMD}")
-    print(f"   Max Retries: {config.MAX_RETRIES}")
-    print(f"   Retry Delay: {config.RETRY_DELAY}s")
+    # Log startup info
+    logger.info("🚀 Starting Discord bot...")
+    logger.info(f"📋 Configuration:")
+    logger.info(f"   Channel ID: {config.CHANNEL_ID}")
+    logger.info(f"   Run Time: {config.RUN_TIME_HOUR:02d}:{config.RUN_TIME_MINUTE:02d}")
+    logger.info(f"   Script: {config.SCRIPT_PATH}")
+    logger.info(f"   In-process: {config.RUN_IN_PROCESS}")
+    logger.info(f"   Python: {config.PYTHON_CMD}")
+    logger.info(f"   Max Retries: {config.MAX_RETRIES}")
+    logger.info(f"   Retry Delay: {config.RETRY_DELAY}s")
     
     # Run bot
     bot.run(config.DISCORD_TOKEN)
@@ -1,87 +1,130 @@
 """Discord bot commands for House Duties Scheduler."""
+from collections import defaultdict
 import discord
 from discord.ext import commands
-from datetime import datetime, date as dt_date
+from datetime import datetime
 from typing import Optional
-import json
 import os
 
-from .scheduler import load_schedule, run_scheduler_with_retry
+from house_duties.utils import json_loads
+
+from .scheduler import (
+    load_schedule,
+    load_schedule_index,
+    run_scheduler_with_retry,
+    schedule_digest,
+    last_posted_digest,
+    record_posted_digest,
+    run_in_thread
+)
 from .embeds import (
-    create_header_embed,
-    create_day_embed,
-    create_footer_embed,
+    create_schedule_messages,
     create_error_embed,
     create_member_chores_embed,
     create_today_chores_embed,
     create_status_embed
 )
 from .config import COLOR_SUCCESS, COLOR_WARNING
+from .send_queue import send_queue
+
+
+# Parsed discord_mapping.json, reused until the file's mtime changes.
+# "lower" maps lowercased Discord names for case-insensitive lookups.
+_mapping_cache = {"path": None, "mtime": None, "data": {}, "lower": {}}
+
+
+# Rendered command embeds (as dicts) for the schedule index they were built from
+_embed_cache = {"index": None, "embeds": {}}
 
 
-def load_discord_mapping():
+def cached_embed(schedule, key, render) -> discord.Embed:
+    """Return a copy of the embed for key, rendering it once per schedule index."""
+    if _embed_cache["index"] is not schedule:
+        _embed_cache.update(index=schedule, embeds={})
+    data = _embed_cache["embeds"].get(key)
+    if data is None:
+        data = _embed_cache["embeds"][key] = render().to_dict()
+    embed = discord.Embed.from_dict(data)
+    if embed.timestamp:
+        embed.timestamp = datetime.now()
+    return embed
+
+
+def _read_discord_mapping(mapping_path: str) -> dict:
+    """Read and parse the mapping file (blocking; run in a worker thread)."""
+    try:
+        with open(mapping_path, 'rb') as f:
+            return json_loads(f.read()).get('mappings', {})
+    except Exception:
+        return {}
+
+
+async def load_discord_mapping(mapping_path: str = "config/discord_mapping.json"):
     """Load Discord username to brother name mapping."""
-    mapping_path = "config/discord_mapping.json"
-    if os.path.exists(mapping_path):
-        try:
-            with open(mapping_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('mappings', {})
-        except:
-            pass
-    return {}
-
-
-def get_brother_name(member: discord.Member) -> str:
+    try:
+        mtime = (await run_in_thread(os.stat, mapping_path)).st_mtime_ns
+    except OSError:
+        _mapping_cache.update(path=None, mtime=None, data={}, lower={})
+        return {}
+    if _mapping_cache["path"] != mapping_path or _mapping_cache["mtime"] != mtime:
+        data = await run_in_thread(_read_discord_mapping, mapping_path)
+        _mapping_cache.update(
+            path=mapping_path,
+            mtime=mtime,
+            data=data,
+            lower={name.lower(): brother for name, brother in data.items()}
+        )
+    return _mapping_cache["data"]
+
+
+async def get_brother_name(member: discord.Member) -> str:
     """Get brother name from Discord member, checking mapping file first."""
-    mapping = load_discord_mapping()
-    
-    # Try display name first (server nickname)
-    if member.display_name in mapping:
-        return mapping[member.display_name]
-    
-    # Try username (global username)
-    if member.name in mapping:
-        return mapping[member.name]
+    mapping = await load_discord_mapping()
+    lower = _mapping_cache["lower"]
     
-    # Try case-insensitive matching
-    display_lower = member.display_name.lower()
-    name_lower = member.name.lower()
-    for discord_name, brother_name in mapping.items():
-        if discord_name.lower() == display_lower or discord_name.lower() == name_lower:
-            return brother_name
+    # Try display name first (server nickname), then username (global
+    # username), exactly and then case-insensitively
+    brother = (
+        mapping.get(member.display_name)
+        or mapping.get(member.name)
+        or lower.get(member.display_name.lower())
+        or lower.get(member.name.lower())
+    )
+    if brother:
+        return brother
     
     # Fall back to display name then username
     return member.display_name or member.name
 
 
 async def send_schedule_embeds(channel, schedule_data):
-    """Send schedule using Discord embeds for better formatting."""
-    # Header
-    await channel.send(embed=create_header_embed())
-    
-    # Group schedule by date
-    by_date = {}
-    for item in schedule_data:
-        date = item['due'].split(' ')[0]
-        if date not in by_date:
-            by_date[date] = []
-        by_date[date].append(item)
+    """Send schedule using Discord embeds, packing several embeds per message."""
+    for message in create_schedule_messages(schedule_data):
+        await send_queue.send(channel, **message)
+
+
+async def post_schedule(channel, schedule_data, status_msg) -> bool:
+    """
+    Replace the status message with the schedule, unless it is unchanged.
     
-    # Send embeds for each date
-    for date_str in sorted(by_date.keys()):
-        # Group by deck
-        by_deck = {}
-        for item in by_date[date_str]:
-            deck = item['deck']
-            if deck not in by_deck:
-                by_deck[deck] = []
-            by_deck[deck].append(item)
-        
-        await channel.send(embed=create_day_embed(date_str, by_deck))
+    Returns:
+        True if the schedule was posted, False if it matched the last post
+    """
+    # File reads/writes run in worker threads to keep them off the event loop
+    digest = await run_in_thread(schedule_digest)
+    if digest is not None and digest == await run_in_thread(last_posted_digest):
+        await status_msg.edit(embed=create_status_embed(
+            "ℹ️ Schedule Unchanged",
+            "The generated schedule is identical to the one already posted.",
+            "info"
+        ))
+        return False
     
-    # Footer
-    await channel.send(embed=create_footer_embed())
+    await status_msg.delete()
+    await send_schedule_embeds(channel, schedule_data)
+    if digest is not None:
+        await run_in_thread(record_posted_digest, digest)
+    return True
 
 
 def setup_commands(bot: commands.Bot, config):
@@ -91,7 +134,7 @@ def setup_commands(bot: commands.Bot, config):
     @commands.has_permissions(administrator=True)
     async def run_schedule(ctx):
         """Manually trigger the scheduler (admin only)."""
-        status_msg = await ctx.send(embed=create_status_embed(
+        status_msg = await send_queue.send(ctx, embed=create_status_embed(
             "🔄 Running Scheduler",
             "Generating schedule manually...",
             "info"
@@ -101,21 +144,28 @@ def setup_commands(bot: commands.Bot, config):
             config.PYTHON_CMD,
             config.SCRIPT_PATH,
             config.MAX_RETRIES,
-            config.RETRY_DELAY
+            config.RETRY_DELAY,
+            config.RUN_IN_PROCESS
         )
         
         if success and schedule_data:
-            await status_msg.delete()
-            await send_schedule_embeds(ctx.channel, schedule_data)
+            posted = await post_schedule(ctx.channel, schedule_data, status_msg)
             
             # Send confirmation DM to user
             try:
-                dm_embed = create_status_embed(
-                    "✅ Schedule Generated",
-                    f"Schedule successfully generated in {ctx.channel.mention}",
-                    "success"
-                )
-                await ctx.author.send(embed=dm_embed)
+                if posted:
+                    dm_embed = create_status_embed(
+                        "✅ Schedule Generated",
+                        f"Schedule successfully generated in {ctx.channel.mention}",
+                        "success"
+                    )
+                else:
+                    dm_embed = create_status_embed(
+                        "ℹ️ Schedule Unchanged",
+                        f"The schedule matches the one already posted; nothing new was posted in {ctx.channel.mention}",
+                        "info"
+                    )
+                await send_queue.send(ctx.author, embed=dm_embed)
             except:
                 pass  # User has DMs disabled
         else:
@@ -129,59 +179,53 @@ def setup_commands(bot: commands.Bot, config):
         Usage: !my-chores [@member]
         """
         target = member or ctx.author
-        brother_name = get_brother_name(target)
-        schedule_data = await load_schedule()
+        brother_name = await get_brother_name(target)
+        schedule = await load_schedule_index()
         
-        if not schedule_data:
+        if not schedule:
             embed = create_status_embed(
                 "📋 No Schedule Available",
                 "No schedule has been generated yet.\nAsk an admin to run `!run-schedule`.",
                 "warning"
             )
-            await ctx.send(embed=embed)
+            await send_queue.send(ctx, embed=embed)
             return
         
-        # Find chores for this member
-        member_chores = {}
-        for item in schedule_data:
-            # Check if brother_name is in the assigned list
-            if brother_name in item['assigned']:
-                date = item['due'].split(' ')[0]
-                if date not in member_chores:
-                    member_chores[date] = []
-                member_chores[date].append(item)
+        def render():
+            # Group this member's chores by date
+            member_chores = defaultdict(list)
+            for item in schedule.by_member.get(brother_name, []):
+                member_chores[item.date].append(item)
+            return create_member_chores_embed(target, member_chores)
         
-        await ctx.send(embed=create_member_chores_embed(target, member_chores))
+        key = ("member", target.id, target.display_name, target.display_avatar.url, brother_name)
+        await send_queue.send(ctx, embed=cached_embed(schedule, key, render))
     
     
     @bot.command(name='chores-today', aliases=['today', 'chores'])
     async def chores_today(ctx):
         """View all chores due today."""
-        schedule_data = await load_schedule()
+        schedule = await load_schedule_index()
         
-        if not schedule_data:
+        if not schedule:
             embed = create_status_embed(
                 "📋 No Schedule Available",
                 "No schedule has been generated yet.\nAsk an admin to run `!run-schedule`.",
                 "warning"
             )
-            await ctx.send(embed=embed)
+            await send_queue.send(ctx, embed=embed)
             return
         
-        # Get today's date
-        today = dt_date.today().isoformat()
+        # Get today's date once and reuse it for the embed title
+        now = datetime.now()
+        today = now.date().isoformat()
         
-        # Find today's chores
-        today_chores = {}
-        for item in schedule_data:
-            date = item['due'].split(' ')[0]
-            if date == today:
-                deck = item['deck']
-                if deck not in today_chores:
-                    today_chores[deck] = []
-                today_chores[deck].append(item)
-        
-        await ctx.send(embed=create_today_chores_embed(today_chores))
+        embed = cached_embed(
+            schedule,
+            ("today", today),
+            lambda: create_today_chores_embed(schedule.by_date.get(today, []), now)
+        )
+        await send_queue.send(ctx, embed=embed)
     
     
     @bot.command(name='ping')
@@ -205,4 +249,4 @@ def setup_commands(bot: commands.Bot, config):
         )
         
         embed.set_footer(text=f"Scheduled run: Sundays at {config.RUN_TIME_HOUR:02d}:{config.RUN_TIME_MINUTE:02d}")
-        await ctx.send(embed=embed)
+        await send_queue.send(ctx, embed=embed)
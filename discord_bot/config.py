@@ -1,38 +1,59 @@
 """Configuration management for Discord bot."""
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Final
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@dataclass(frozen=True, repr=False)  # repr would expose the token
 class BotConfig:
-    """Discord bot configuration from environment variables."""
+    """Discord bot configuration, read and validated once at startup."""
+    __slots__ = (
+        "DISCORD_TOKEN", "CHANNEL_ID", "RUN_TIME_HOUR", "RUN_TIME_MINUTE",
+        "SCRIPT_PATH", "PYTHON_CMD", "MAX_RETRIES", "RETRY_DELAY", "RUN_IN_PROCESS"
+    )
     
-    def __init__(self):
-        self.DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
-        self.CHANNEL_ID = os.getenv("CHANNEL_ID")
-        self.RUN_TIME_HOUR = int(os.getenv("RUN_TIME_HOUR", "8"))
-        self.RUN_TIME_MINUTE = int(os.getenv("RUN_TIME_MINUTE", "0"))
-        self.SCRIPT_PATH = os.getenv("SCRIPT_PATH", "house_duties.py")
-        self.PYTHON_CMD = os.getenv("PYTHON_CMD", "python")
-        self.MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-        self.RETRY_DELAY = int(os.getenv("RETRY_DELAY", "5"))
+    DISCORD_TOKEN: str
+    CHANNEL_ID: int
+    RUN_TIME_HOUR: int
+    RUN_TIME_MINUTE: int
+    SCRIPT_PATH: str
+    PYTHON_CMD: str
+    MAX_RETRIES: int
+    RETRY_DELAY: int
+    RUN_IN_PROCESS: bool
+    
+    @classmethod
+    def from_env(cls) -> "BotConfig":
+        """Build the configuration from environment variables."""
+        channel_id = os.getenv("CHANNEL_ID")
+        if not channel_id:
+            raise ValueError("CHANNEL_ID environment variable is required. See .env.example")
+        try:
+            channel_id = int(channel_id)
+        except ValueError:
+            raise ValueError(f"CHANNEL_ID must be a valid integer, got: {channel_id}")
         
-        self._validate()
+        return cls(
+            DISCORD_TOKEN=os.getenv("DISCORD_TOKEN"),
+            CHANNEL_ID=channel_id,
+            RUN_TIME_HOUR=int(os.getenv("RUN_TIME_HOUR", "8")),
+            RUN_TIME_MINUTE=int(os.getenv("RUN_TIME_MINUTE", "0")),
+            SCRIPT_PATH=os.getenv("SCRIPT_PATH", "house_duties.py"),
+            PYTHON_CMD=os.getenv("PYTHON_CMD", "python"),
+            MAX_RETRIES=int(os.getenv("MAX_RETRIES", "3")),
+            RETRY_DELAY=int(os.getenv("RETRY_DELAY", "5")),
+            RUN_IN_PROCESS=os.getenv("RUN_IN_PROCESS", "true").strip().lower() in ("1", "true", "yes")
+        )
     
-    def _validate(self):
+    def __post_init__(self):
         """Validate configuration values."""
         if not self.DISCORD_TOKEN:
             raise ValueError("DISCORD_TOKEN environment variable is required. See .env.example")
         
-        if not self.CHANNEL_ID:
-            raise ValueError("CHANNEL_ID environment variable is required. See .env.example")
-        
-        try:
-            self.CHANNEL_ID = int(self.CHANNEL_ID)
-        except ValueError:
-            raise ValueError(f"CHANNEL_ID must be a valid integer, got: {self.CHANNEL_ID}")
-        
         if not (0 <= self.RUN_TIME_HOUR <= 23):
             raise ValueError(f"RUN_TIME_HOUR must be 0-23, got: {self.RUN_TIME_HOUR}")
         
@@ -41,16 +62,20 @@ class BotConfig:
 
 
 # Color constants for embeds
-COLOR_SUCCESS = 0x00ff00  # Green
-COLOR_ERROR = 0xff0000    # Red
-COLOR_INFO = 0x3498db     # Blue
-COLOR_WARNING = 0xffa500  # Orange
+COLOR_SUCCESS: Final[int] = 0x00ff00  # Green
+COLOR_ERROR: Final[int] = 0xff0000    # Red
+COLOR_INFO: Final[int] = 0x3498db     # Blue
+COLOR_WARNING: Final[int] = 0xffa500  # Orange
+
+# Display order for decks; unknown decks are shown under "Other"
+DECK_ORDER = ("Zero Deck", "First Deck", "Second Deck", "Third Deck", "Other")
+DECK_INDEX = MappingProxyType({name: i for i, name in enumerate(DECK_ORDER)})
 
-# Deck colors for visual distinction
-DECK_COLORS = {
+# Deck colors for visual distinction (read-only, shared across modules)
+DECK_COLORS = MappingProxyType({
     "Zero Deck": 0x9b59b6,   # Purple
     "First Deck": 0x3498db,  # Blue
     "Second Deck": 0x2ecc71, # Green
     "Third Deck": 0xe74c3c,  # Red
     "Other": 0x95a5a6        # Gray
-}
+})
@@ -1,8 +1,29 @@
 """Embed formatting utilities for Discord messages."""
+import io
+from collections import defaultdict
 import discord
-from datetime import datetime
-from typing import List, Dict
-from .config import COLOR_SUCCESS, COLOR_INFO, COLOR_WARNING, COLOR_ERROR, DECK_COLORS
+from datetime import date, datetime
+from typing import Any, List, Dict, Optional
+from .config import (
+    COLOR_SUCCESS, COLOR_INFO, COLOR_WARNING, COLOR_ERROR, DECK_COLORS,
+    DECK_ORDER, DECK_INDEX
+)
+from .scheduler import ScheduleItem
+
+
+# Discord allows up to 10 embeds and 6000 embed characters per message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+MAX_FIELDS_PER_EMBED = 25
+
+
+def group_by_deck(items: List[ScheduleItem]) -> List[List[ScheduleItem]]:
+    """Bucket items into one list per deck, in DECK_ORDER, in a single pass."""
+    groups: List[List[ScheduleItem]] = [[] for _ in DECK_ORDER]
+    other = len(DECK_ORDER) - 1
+    for item in items:
+        groups[DECK_INDEX.get(item.deck, other)].append(item)
+    return groups
 
 
 def create_header_embed() -> discord.Embed:
@@ -18,9 +39,9 @@ def create_header_embed() -> discord.Embed:
     return embed
 
 
-def create_day_embed(date_str: str, tasks_by_deck: Dict[str, List[Dict]]) -> discord.Embed:
-    """Create embed for a single day's chores."""
-    dt = datetime.fromisoformat(date_str)
+def create_day_embed(date_str: str, deck_groups: List[List[ScheduleItem]]) -> discord.Embed:
+    """Create embed for a single day's chores, given per-deck lists in DECK_ORDER."""
+    dt = date.fromisoformat(date_str)
     dow = dt.strftime('%A')
     
     embed = discord.Embed(
@@ -28,13 +49,12 @@ def create_day_embed(date_str: str, tasks_by_deck: Dict[str, List[Dict]]) -> dis
         color=COLOR_INFO
     )
     
-    deck_order = ["Zero Deck", "First Deck", "Second Deck", "Third Deck", "Other"]
-    for deck in deck_order:
-        if deck in tasks_by_deck:
-            tasks_text = ""
-            for item in tasks_by_deck[deck]:
-                assigned = ", ".join(item['assigned'])
-                tasks_text += f"• **{item['task']}**\n  └ {assigned}\n"
+    for deck, deck_items in zip(DECK_ORDER, deck_groups):
+        if deck_items:
+            tasks_text = "".join(
+                f"• **{item.task}**\n  └ {item.assigned_display}\n"
+                for item in deck_items
+            )
             
             # Discord has a 1024 char limit per field
             if len(tasks_text) > 1000:
@@ -48,6 +68,24 @@ def create_day_embed(date_str: str, tasks_by_deck: Dict[str, List[Dict]]) -> dis
     return embed
 
 
+def embed_fits(embed: discord.Embed) -> bool:
+    """Return True if Discord will accept the embed on its own."""
+    return len(embed) <= MAX_EMBED_CHARS_PER_MESSAGE and len(embed.fields) <= MAX_FIELDS_PER_EMBED
+
+
+def create_day_attachment(date_str: str, deck_groups: List[List[ScheduleItem]]) -> discord.File:
+    """Render a day's chores as a markdown file, for days too large for an embed."""
+    lines = [f"# {date.fromisoformat(date_str).strftime('%A, %B %d')}\n"]
+    for deck, deck_items in zip(DECK_ORDER, deck_groups):
+        if deck_items:
+            lines.append(f"\n## {deck}\n\n")
+            lines.extend(
+                f"- **{item.task}**: {item.assigned_display}\n"
+                for item in deck_items
+            )
+    return discord.File(io.BytesIO("".join(lines).encode("utf-8")), filename=f"{date_str}.md")
+
+
 def create_footer_embed() -> discord.Embed:
     """Create footer embed for schedule posting."""
     embed = discord.Embed(
@@ -82,7 +120,7 @@ def create_error_embed(error_msg: str, max_retries: int) -> discord.Embed:
     return embed
 
 
-def create_member_chores_embed(member, chores_by_date: Dict[str, List[Dict]]) -> discord.Embed:
+def create_member_chores_embed(member, chores_by_date: Dict[str, List[ScheduleItem]]) -> discord.Embed:
     """Create embed showing member's assigned chores."""
     if not chores_by_date:
         embed = discord.Embed(
@@ -101,15 +139,15 @@ def create_member_chores_embed(member, chores_by_date: Dict[str, List[Dict]]) ->
     embed.set_thumbnail(url=member.display_avatar.url)
     
     total_chores = 0
-    for date_str in sorted(chores_by_date.keys()):
-        dt = datetime.fromisoformat(date_str)
+    for date_str, day_items in sorted(chores_by_date.items()):
+        dt = date.fromisoformat(date_str)
         dow = dt.strftime('%A, %b %d')
         
-        chores_text = ""
-        for item in chores_by_date[date_str]:
-            assigned = ", ".join(item['assigned'])
-            chores_text += f"• **{item['task']}** ({item['deck']})\n  └ With: {assigned}\n"
-            total_chores += 1
+        chores_text = "".join(
+            f"• **{item.task}** ({item.deck})\n  └ With: {item.assigned_display}\n"
+            for item in day_items
+        )
+        total_chores += len(day_items)
         
         embed.add_field(name=dow, value=chores_text, inline=False)
     
@@ -117,9 +155,9 @@ def create_member_chores_embed(member, chores_by_date: Dict[str, List[Dict]]) ->
     return embed
 
 
-def create_today_chores_embed(chores_by_deck: Dict[str, List[Dict]]) -> discord.Embed:
-    """Create embed showing today's chores."""
-    if not chores_by_deck:
+def create_today_chores_embed(today_items: List[ScheduleItem], now: Optional[datetime] = None) -> discord.Embed:
+    """Create embed showing today's chores (as of now, if given)."""
+    if not today_items:
         embed = discord.Embed(
             title="📅 No Chores Today",
             description="No chores are due today! 🎉",
@@ -127,7 +165,7 @@ def create_today_chores_embed(chores_by_deck: Dict[str, List[Dict]]) -> discord.
         )
         return embed
     
-    now = datetime.now()
+    now = now or datetime.now()
     embed = discord.Embed(
         title=f"📅 Chores for {now.strftime('%A, %B %d')}",
         description="Today's assignments:",
@@ -135,18 +173,16 @@ def create_today_chores_embed(chores_by_deck: Dict[str, List[Dict]]) -> discord.
         timestamp=now
     )
     
-    deck_order = ["Zero Deck", "First Deck", "Second Deck", "Third Deck", "Other"]
-    for deck in deck_order:
-        if deck in chores_by_deck:
-            chores_text = ""
-            for item in chores_by_deck[deck]:
-                assigned = ", ".join(item['assigned'])
-                chores_text += f"• **{item['task']}**\n  └ {assigned}\n"
+    for deck, deck_items in zip(DECK_ORDER, group_by_deck(today_items)):
+        if deck_items:
+            chores_text = "".join(
+                f"• **{item.task}**\n  └ {item.assigned_display}\n"
+                for item in deck_items
+            )
             
             embed.add_field(name=deck, value=chores_text, inline=False)
     
-    total = sum(len(c) for c in chores_by_deck.values())
-    embed.set_footer(text=f"Total: {total} chores")
+    embed.set_footer(text=f"Total: {len(today_items)} chores")
     return embed
 
 
@@ -166,3 +202,57 @@ def create_status_embed(title: str, description: str, status_type: str = "info")
         timestamp=datetime.now()
     )
     return embed
+
+
+def batch_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Pack embeds, in order, into as few messages as Discord's limits allow."""
+    batches: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    current_chars = 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE
+                        or current_chars + size > MAX_EMBED_CHARS_PER_MESSAGE):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(embed)
+        current_chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def create_schedule_messages(schedule_data: List[ScheduleItem]) -> List[Dict[str, Any]]:
+    """
+    Build the messages that post a full schedule, as channel.send() kwargs.
+    
+    Header, one embed per date and footer are packed with batch_embeds; a
+    date too large for an embed becomes its own message with an attachment.
+    """
+    messages: List[Dict[str, Any]] = []
+    pending = [create_header_embed()]
+    
+    # Group schedule by date and deck in a single pass
+    other = len(DECK_ORDER) - 1
+    by_date = defaultdict(lambda: [[] for _ in DECK_ORDER])
+    for item in schedule_data:
+        by_date[item.date][DECK_INDEX.get(item.deck, other)].append(item)
+    
+    # Keys are unique, so sorting the items only ever compares dates
+    for date_str, deck_groups in sorted(by_date.items()):
+        embed = create_day_embed(date_str, deck_groups)
+        if embed_fits(embed):
+            pending.append(embed)
+            continue
+        
+        # Too large for an embed: upload the whole day as one attachment
+        messages.extend({"embeds": batch} for batch in batch_embeds(pending))
+        pending = []
+        messages.append({
+            "content": f"**{embed.title}**",
+            "file": create_day_attachment(date_str, deck_groups)
+        })
+    
+    pending.append(create_footer_embed())
+    messages.extend({"embeds": batch} for batch in batch_embeds(pending))
+    return messages
@@ -1,89 +1,312 @@
 """Scheduler execution and schedule loading utilities."""
-import subprocess
 import asyncio
+import hashlib
 import json
+import logging
 import os
-from typing import Optional, List, Dict, Tuple
+import random
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional, List, Dict, NamedTuple, Tuple
 
+from house_duties.cli import generate_schedule, parse_arguments
+from house_duties.utils import json_loads
 
-async def load_schedule(filepath: str = "data/schedule.json") -> Optional[List[Dict]]:
-    """Load schedule.json with error handling."""
+logger = logging.getLogger(__name__)
+
+
+# Seconds to wait for a scheduler run before giving up on the attempt
+SCHEDULER_TIMEOUT = 60
+
+# Bytes of a failed scheduler subprocess's stderr included in the error
+STDERR_TAIL_BYTES = 500
+
+# Upper bound on the delay between retry attempts, in seconds
+MAX_RETRY_DELAY = 60
+
+# Digest of the last schedule posted to Discord, used to skip duplicate posts
+SCHEDULE_HASH_FILE = "data/.schedule.hash"
+
+# Parsed schedule (and its index), reused until the file's mtime changes
+_cache = {"path": None, "mtime": None, "data": None, "index": None}
+
+# Reads in progress, keyed by (path, mtime), so concurrent loads share one read
+_inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+
+# The current in-process scheduler run; its thread can't be killed, so a new
+# run must not start while this is still going
+_in_process_run: Optional[asyncio.Future] = None
+
+
+class ScheduleItem(NamedTuple):
+    """The fields of a schedule entry that the bot displays."""
+    due: str
+    deck: str
+    task: str
+    assigned: Tuple[str, ...]
+    assigned_display: str  # ", "-joined names, built once at load
+    date: str  # YYYY-MM-DD part of due, split off once at load
+
+
+def to_schedule_items(raw_items: List[Dict[str, Any]]) -> List[ScheduleItem]:
+    """Convert schedule dicts (as written to schedule.json) into ScheduleItems."""
+    return [
+        ScheduleItem(
+            d['due'], d['deck'], d['task'],
+            tuple(d['assigned']), ", ".join(d['assigned']), d['due'][:10]
+        )
+        for d in raw_items
+    ]
+
+
+@dataclass
+class ScheduleIndex:
+    """Schedule items grouped once so commands can look them up directly."""
+    items: List[ScheduleItem]
+    by_member: Dict[str, List[ScheduleItem]]
+    by_date: Dict[str, List[ScheduleItem]]
+    by_deck: Dict[str, List[ScheduleItem]]
+
+
+def build_schedule_index(schedule_data: List[ScheduleItem]) -> ScheduleIndex:
+    """Group schedule items by assigned member, due date (YYYY-MM-DD) and deck."""
+    by_member: Dict[str, List[ScheduleItem]] = defaultdict(list)
+    by_date: Dict[str, List[ScheduleItem]] = defaultdict(list)
+    by_deck: Dict[str, List[ScheduleItem]] = defaultdict(list)
+    for item in schedule_data:
+        by_date[item.date].append(item)
+        by_deck[item.deck].append(item)
+        for name in item.assigned:
+            by_member[name].append(item)
+    return ScheduleIndex(schedule_data, dict(by_member), dict(by_date), dict(by_deck))
+
+
+async def run_in_thread(func, *args):
+    """Run a blocking call in the default thread pool (like asyncio.to_thread, which needs 3.9)."""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def invalidate_schedule_cache() -> None:
+    """Forget the cached schedule so the next load re-reads the file."""
+    _cache.update(path=None, mtime=None, data=None, index=None)
+
+
+def _read_schedule(filepath: str) -> List[ScheduleItem]:
+    """Read and parse schedule.json (blocking; run in a worker thread)."""
+    return to_schedule_items(json_loads(Path(filepath).read_bytes()))
+
+
+async def _refresh_schedule(filepath: str, mtime: int) -> List[ScheduleItem]:
+    """Parse the schedule in a worker thread and store it in the cache."""
+    data = await run_in_thread(_read_schedule, filepath)
+    _cache.update(path=filepath, mtime=mtime, data=data, index=None)
+    return data
+
+
+async def load_schedule(filepath: str = "data/schedule.json") -> Optional[List[ScheduleItem]]:
+    """Load schedule.json with error handling, reusing the last parse if unchanged."""
     try:
-        if not os.path.exists(filepath):
-            print(f"❌ Schedule file not found: {filepath}")
+        try:
+            mtime = (await run_in_thread(os.stat, filepath)).st_mtime_ns
+        except FileNotFoundError:
+            logger.error(f"❌ Schedule file not found: {filepath}")
             return None
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print(f"❌ Error: {filepath} is invalid JSON")
+        if _cache["path"] == filepath and _cache["mtime"] == mtime:
+            return _cache["data"]
+        key = (filepath, mtime)
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(_refresh_schedule(filepath, mtime))
+            _inflight[key] = task
+            task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shielded so a cancelled command doesn't cancel the shared read
+        return await asyncio.shield(task)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+        logger.error(f"❌ Error: {filepath} is invalid JSON")
         return None
     except Exception as e:
-        print(f"❌ Error loading schedule: {e}")
+        logger.error(f"❌ Error loading schedule: {e}")
+        return None
+
+
+async def load_schedule_index(filepath: str = "data/schedule.json") -> Optional[ScheduleIndex]:
+    """Load the schedule and return its index, built at most once per parse."""
+    data = await load_schedule(filepath)
+    if not data:
         return None
+    index = _cache["index"]
+    if index is None or index.items is not data:
+        index = build_schedule_index(data)
+        if _cache["data"] is data:
+            _cache["index"] = index
+    return index
+
+
+def schedule_digest(filepath: str = "data/schedule.json") -> Optional[str]:
+    """Return a short content hash of the schedule file, or None if unreadable."""
+    try:
+        return hashlib.blake2b(Path(filepath).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def last_posted_digest(hash_file: str = SCHEDULE_HASH_FILE) -> Optional[str]:
+    """Return the digest recorded after the last successful post, if any."""
+    try:
+        return Path(hash_file).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def record_posted_digest(digest: str, hash_file: str = SCHEDULE_HASH_FILE) -> None:
+    """Remember the digest of the schedule that was just posted."""
+    try:
+        Path(hash_file).write_text(digest, encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"⚠️ Could not record schedule hash: {e}")
+
+
+def next_sunday_run(hour: int, minute: int, after: datetime) -> datetime:
+    """Return the first Sunday at hour:minute strictly after the given time, in its timezone."""
+    target = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    target += timedelta(days=(6 - after.weekday()) % 7)
+    if target <= after:
+        target += timedelta(days=7)
+    return target
+
+
+def retry_backoff(attempt: int, base_delay: float, cap: float = MAX_RETRY_DELAY) -> float:
+    """Return a jittered exponential delay before retrying after the given attempt."""
+    return min(cap, base_delay * 2 ** (attempt - 1)) * random.uniform(0.75, 1.25)
+
+
+def in_process_run_active() -> bool:
+    """Return True while an in-process scheduler thread is still running."""
+    return _in_process_run is not None and not _in_process_run.done()
+
+
+async def run_scheduler_in_process() -> List[ScheduleItem]:
+    """
+    Run the scheduler in a worker thread and return the generated schedule.
+    
+    On timeout only the wait is abandoned; the thread keeps running and
+    in_process_run_active() stays True until it finishes.
+    """
+    global _in_process_run
+    if in_process_run_active():
+        raise RuntimeError("A previous scheduler run is still in progress")
+    args = parse_arguments(["--quiet"])
+    _in_process_run = asyncio.get_running_loop().run_in_executor(None, generate_schedule, args)
+    # Shielded so the timeout doesn't mark the run done while its thread is alive
+    schedule = await asyncio.wait_for(asyncio.shield(_in_process_run), timeout=SCHEDULER_TIMEOUT)
+    return to_schedule_items(schedule)
 
 
 async def run_scheduler_with_retry(
     python_cmd: str,
     script_path: str,
     max_retries: int = 3,
-    retry_delay: int = 5
-) -> Tuple[bool, Optional[str], Optional[List[Dict]]]:
+    retry_delay: int = 5,
+    in_process: bool = True
+) -> Tuple[bool, Optional[str], Optional[List[ScheduleItem]]]:
     """
     Run the scheduler with retry logic.
     
+    When in_process is True the scheduler is imported and called directly;
+    otherwise script_path is executed with python_cmd in a subprocess.
+    An in-process run that times out is not retried, since its thread
+    can't be stopped and a second run would write the same files.
+    
     Returns:
         Tuple of (success, error_message, schedule_data)
     """
+    if in_process and in_process_run_active():
+        error_msg = "A previous scheduler run is still in progress"
+        logger.warning(f"⚠️ {error_msg}")
+        return False, error_msg, None
+    
     for attempt in range(1, max_retries + 1):
         try:
-            print(f"🏃 Running scheduler (attempt {attempt}/{max_retries})...")
+            logger.info(f"🏃 Running scheduler (attempt {attempt}/{max_retries})...")
+            
+            if in_process:
+                schedule_data = await run_scheduler_in_process()
+                invalidate_schedule_cache()
+                if schedule_data:
+                    logger.info(f"✅ Scheduler completed successfully")
+                    return True, None, schedule_data
+                else:
+                    error_msg = "Scheduler ran but produced an empty schedule"
+                    logger.warning(f"⚠️ {error_msg}")
+                    return False, error_msg, None
             
-            result = subprocess.run(
-                [python_cmd, script_path],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(script_path)),
-                timeout=60  # 60 second timeout
-            )
+            # The schedule is read back from schedule.json, so stdout is
+            # discarded; stderr goes to a temporary file rather than a pipe
+            # so a chatty scheduler can never stall on a full pipe buffer
+            with tempfile.TemporaryFile() as err:
+                proc = await asyncio.create_subprocess_exec(
+                    python_cmd, script_path,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=err,
+                    cwd=os.path.dirname(os.path.abspath(script_path))
+                )
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=SCHEDULER_TIMEOUT)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+                # Only the end of stderr (where a traceback finishes) is reported
+                err.seek(max(0, err.seek(0, os.SEEK_END) - STDERR_TAIL_BYTES))
+                stderr = err.read()
             
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 # Success!
+                invalidate_schedule_cache()
                 schedule_data = await load_schedule()
                 if schedule_data:
-                    print(f"✅ Scheduler completed successfully")
+                    logger.info(f"✅ Scheduler completed successfully")
                     return True, None, schedule_data
                 else:
                     error_msg = "Scheduler ran but schedule.json not found or invalid"
-                    print(f"⚠️ {error_msg}")
+                    logger.warning(f"⚠️ {error_msg}")
                     return False, error_msg, None
             else:
                 # Non-zero exit code
-                error_msg = f"Exit code {result.returncode}\n{result.stderr[:500]}"
-                print(f"❌ Scheduler failed: {error_msg}")
+                error_msg = f"Exit code {proc.returncode}\n{stderr.decode('utf-8', 'replace')}"
+                logger.error(f"❌ Scheduler failed: {error_msg}")
                 
                 if attempt < max_retries:
-                    print(f"⏳ Retrying in {retry_delay} seconds...")
-                    await asyncio.sleep(retry_delay)
+                    delay = retry_backoff(attempt, retry_delay)
+                    logger.info(f"⏳ Retrying in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
                 else:
                     return False, error_msg, None
                     
-        except subprocess.TimeoutExpired:
-            error_msg = "Scheduler timed out after 60 seconds"
-            print(f"⏱️ {error_msg}")
+        except asyncio.TimeoutError:
+            error_msg = f"Scheduler timed out after {SCHEDULER_TIMEOUT} seconds"
+            logger.warning(f"⏱️ {error_msg}")
             
+            if in_process:
+                return False, f"{error_msg} (still running in the background; not retried)", None
             if attempt < max_retries:
-                print(f"⏳ Retrying in {retry_delay} seconds...")
-                await asyncio.sleep(retry_delay)
+                delay = retry_backoff(attempt, retry_delay)
+                logger.info(f"⏳ Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
             else:
                 return False, error_msg, None
                 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error(f"❌ {error_msg}")
             
             if attempt < max_retries:
-                print(f"⏳ Retrying in {retry_delay} seconds...")
-                await asyncio.sleep(retry_delay)
+                delay = retry_backoff(attempt, retry_delay)
+                logger.info(f"⏳ Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
             else:
                 return False, error_msg, None
     
@@ -0,0 +1,116 @@
+"""Paced message sending shared by commands and the weekly scheduler."""
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+# Pause between consecutive messages to one channel, to stay under
+# Discord's per-channel limit of 5 messages per 5 seconds
+SEND_INTERVAL = 1.0
+
+# Attempts per message when Discord answers 429 Too Many Requests
+MAX_SEND_ATTEMPTS = 3
+
+
+def _retry_after(error: discord.HTTPException) -> float:
+    """Seconds Discord asked us to wait before retrying, defaulting to 1."""
+    try:
+        return float(error.response.headers.get("Retry-After", 1))
+    except (AttributeError, TypeError, ValueError):
+        return 1.0
+
+
+def _destination_key(destination: discord.abc.Messageable):
+    """Rate-limit bucket for destination: its channel (or DM user) id."""
+    target = getattr(destination, "channel", destination)  # commands.Context
+    return getattr(target, "id", None) or id(target)
+
+
+class _ChannelQueue:
+    """Pending sends and pacing state for one channel."""
+    __slots__ = ("queue", "worker", "last_send")
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.worker: Optional[asyncio.Task] = None
+        self.last_send: Optional[float] = None
+
+
+class SendQueue:
+    """
+    Send messages in order per channel, SEND_INTERVAL apart.
+    
+    Each channel (or DM) gets its own queue and worker task, created on
+    first use and retired once idle, so a slow upload or a 429 in one
+    channel never delays replies in another.
+    """
+
+    def __init__(self, interval: float = SEND_INTERVAL):
+        self.interval = interval
+        self._channels: Dict[Any, _ChannelQueue] = {}
+
+    async def send(self, destination: discord.abc.Messageable, **kwargs) -> discord.Message:
+        """Queue destination.send(**kwargs) and return the sent message."""
+        key = _destination_key(destination)
+        channel = self._channels.get(key)
+        if channel is None or channel.worker.done():
+            channel = _ChannelQueue()
+            channel.worker = asyncio.create_task(self._run(key, channel))
+            self._channels[key] = channel
+        future = asyncio.get_running_loop().create_future()
+        channel.queue.put_nowait((destination, kwargs, future))
+        return await future
+
+    async def _run(self, key, channel: _ChannelQueue):
+        """Worker: send one channel's queued messages in order, pacing and retrying as needed."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if channel.queue.empty():
+                    # Stay around for one interval so a follow-up is still paced
+                    if channel.last_send is not None:
+                        await asyncio.sleep(max(0.0, channel.last_send + self.interval - loop.time()))
+                    if channel.queue.empty():
+                        return
+                destination, kwargs, future = channel.queue.get_nowait()
+                if future.cancelled():
+                    continue
+                if channel.last_send is not None:
+                    wait = channel.last_send + self.interval - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                try:
+                    message = await self._send_with_retry(destination, kwargs)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(message)
+                finally:
+                    channel.last_send = loop.time()
+        finally:
+            if self._channels.get(key) is channel:
+                del self._channels[key]
+
+    async def _send_with_retry(self, destination, kwargs) -> discord.Message:
+        """Send once, retrying after Retry-After on 429 responses."""
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            try:
+                return await destination.send(**kwargs)
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == MAX_SEND_ATTEMPTS:
+                    raise
+                delay = _retry_after(e)
+                logger.warning(f"⚠️ Rate limited, retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+                if "file" in kwargs:
+                    kwargs["file"].reset()
+
+
+# Shared by every command and the weekly scheduler
+send_queue = SendQueue()
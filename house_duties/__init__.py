@@ -16,7 +16,10 @@ from .utils import (
     week_start_for,
     dt_on,
     unique_sorted_days,
-    week_index_from_anchor
+    week_index_from_anchor,
+    atomic_write_bytes,
+    json_loads,
+    json_dumps
 )
 from .state import (
     load_state,
@@ -37,6 +40,7 @@ from .templates import build_templates, default_severity_for
 from .assignment import assign_chores, is_banned, preference_bonus
 from .bonus import choose_bonus_tasks_for_week, stable_int_from_strings
 from .scheduler import occurrences_from_templates
+from .cli import generate_schedule
 
 __all__ = [
     "__version__",
@@ -51,6 +55,9 @@ __all__ = [
     "dt_on",
     "unique_sorted_days",
     "week_index_from_anchor",
+    "atomic_write_bytes",
+    "json_loads",
+    "json_dumps",
     # State
     "load_state",
     "save_state",
@@ -76,4 +83,6 @@ __all__ = [
     "stable_int_from_strings",
     # Scheduler
     "occurrences_from_templates",
+    # CLI
+    "generate_schedule",
 ]
@@ -1,13 +1,12 @@
 """Assignment logic for distributing chores to brothers with fairness algorithms."""
 from typing import List, Dict, Tuple, Any, Set
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import date
 import random
 import json
 import os
 import logging
 from .models import Occurrence
-from .utils import DOW
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +109,9 @@ def assign_chores(
     - Jitter: Small random value for tie-breaking
     - Junior Active Pairing: On 2-person tasks, junior actives must be paired with actives
     """
-    random.seed(random_seed)
+    # Own RNG instance: same sequence as seeding the module RNG, without
+    # reseeding global state shared with the rest of the process
+    jitter_random = random.Random(random_seed).random
     
     # Load brother categories for pairing logic
     brother_categories = load_brother_categories()
@@ -129,66 +130,84 @@ def assign_chores(
     max_per_day = constraints.get("max_per_brother_per_day") or 2
     max_per_week = constraints.get("max_per_brother_per_week") or 5
 
+    # Per-brother bans and preferences as sets, built once for the whole run
+    category_bans = {b: frozenset(c) for b, c in constraints.get("brother_category_bans", {}).items()}
+    task_bans = {b: frozenset(t) for b, t in constraints.get("brother_task_bans", {}).items()}
+    preferred = {b: frozenset(c) for b, c in constraints.get("brother_preferred_categories", {}).items()}
+
     # Build active pool
     normal_pool = [b for b in brothers if b not in exempt_all and b not in on_call_only]
     backup_pool = list(on_call_only)
 
-    # Load history
+    # Load history (task counts are updated in place as brothers are picked,
+    # so they cover this run too)
     brother_task_counts = state.get("brother_task_counts", {})
+    # Last week's {task_key: count} per brother. Older state files store a
+    # list of task keys instead; Counter reads either
     last_week_tasks = state.get("brother_last_week_tasks", {})
-    this_week_tasks = defaultdict(list)
+    last_week_counts = {bro: Counter(tasks) for bro, tasks in last_week_tasks.items()}
+    this_week_counts = defaultdict(Counter)  # brother -> {task_key: count}
+    week_totals = Counter()  # brother -> tasks this run
 
     # Brother cumulative load
     brother_loads = defaultdict(float)
 
-    # Track assignments by day for same-day penalty
-    brother_day_counts = defaultdict(lambda: defaultdict(int))
+    # Per-day brother counts for the same-day penalty and daily cap
+    day_counts_by_day = defaultdict(Counter)
 
     schedule = []
 
     for occ in occs:
         assigned = []
-        day_str = occ.due_dt.strftime("%A")
+        # Occurrences on the same day share one Counter
+        day_counts = day_counts_by_day[occ.due_dt.toordinal()]
+
+        # Hard constraints, history and preference don't change between this
+        # occurrence's slots (brothers picked for it drop out), so work them
+        # out once per brother
+        pool = normal_pool if normal_pool else backup_pool
+        eligible = []
+        for bro in pool:
+            if occ.category in category_bans.get(bro, ()) or occ.task_key in task_bans.get(bro, ()):
+                continue
+            
+            if is_unavailable(bro, occ, constraints):
+                continue
+            
+            hist_count = brother_task_counts.get(bro, {}).get(occ.task_key, 0)
+            repeat_pen = hist_count * REPEAT_TASK_PENALTY
+            
+            last_week_count = last_week_counts.get(bro, {}).get(occ.task_key, 0)
+            recent_pen = last_week_count * RECENT_WEEK_PENALTY
+            
+            pref = PREFERENCE_BONUS if occ.category in preferred.get(bro, ()) else 0.0
+            
+            eligible.append((bro, repeat_pen, recent_pen, pref))
+        chosen_set = set()
 
         for _ in range(occ.people_needed):
-            pool = normal_pool if normal_pool else backup_pool
             if not pool:
                 assigned.append("NO_ONE_AVAILABLE")
                 continue
 
             # Score each brother
             candidates = []
-            for bro in pool:
-                # Hard constraints
-                if is_banned(bro, occ, constraints):
-                    continue
-                
-                if is_unavailable(bro, occ, constraints):
+            for bro, repeat_pen, recent_pen, pref in eligible:
+                if bro in chosen_set:
                     continue
 
-                week_count = len(this_week_tasks[bro])
+                week_count = week_totals[bro]
                 if week_count >= max_per_week:
                     continue
 
-                day_count = brother_day_counts[bro][occ.due_dt.date()]
+                day_count = day_counts[bro]
                 if day_count >= max_per_day:
                     continue
 
                 # Fairness scoring
                 base_load = brother_loads[bro]
-                
-                hist_count = brother_task_counts.get(bro, {}).get(occ.task_key, 0)
-                run_count = sum(1 for t in this_week_tasks[bro] if t == occ.task_key)
-                repeat_pen = (hist_count + run_count) * REPEAT_TASK_PENALTY
-                
-                last_week_count = sum(1 for t in last_week_tasks.get(bro, []) if t == occ.task_key)
-                recent_pen = last_week_count * RECENT_WEEK_PENALTY
-                
                 day_pen = day_count * SAME_DAY_PENALTY
-                
-                pref = preference_bonus(bro, occ.category, constraints)
-                
-                jitter = random.random() * 0.01
+                jitter = jitter_random() * 0.01
 
                 score = base_load + repeat_pen + recent_pen + day_pen + pref + jitter
                 candidates.append((score, bro))
@@ -199,8 +218,7 @@ def assign_chores(
                 continue
 
             # Pick lowest score
-            candidates.sort()
-            _, chosen = candidates[0]
+            _, chosen = min(candidates)
             
             # For 2-person tasks, enforce junior active pairing constraint
             # If we already have a junior active and need to pick the 2nd person,
@@ -208,17 +226,19 @@ def assign_chores(
             if occ.people_needed == 2 and len(assigned) == 1:
                 first_assignee = assigned[0]
                 if first_assignee in junior_actives and chosen in junior_actives:
-                    # Both would be junior actives, find an active instead
-                    active_candidates = [c for c in candidates if c[1] in actives]
-                    if active_candidates:
-                        _, chosen = active_candidates[0]
+                    # Both would be junior actives, take the best-scored active instead
+                    _, chosen = min((c for c in candidates if c[1] in actives), default=(None, chosen))
             
             assigned.append(chosen)
+            chosen_set.add(chosen)
 
             # Update tracking
             brother_loads[chosen] += occ.weight
-            this_week_tasks[chosen].append(occ.task_key)
-            brother_day_counts[chosen][occ.due_dt.date()] += 1
+            this_week_counts[chosen][occ.task_key] += 1
+            week_totals[chosen] += 1
+            day_counts[chosen] += 1
+            task_counts = brother_task_counts.setdefault(chosen, {})
+            task_counts[occ.task_key] = task_counts.get(occ.task_key, 0) + 1
 
         # Record assignment
         schedule.append({
@@ -233,12 +253,7 @@ def assign_chores(
         })
 
     # Update persistent state
-    for bro, tasks in this_week_tasks.items():
-        for tk in tasks:
-            brother_task_counts.setdefault(bro, {})
-            brother_task_counts[bro][tk] = brother_task_counts[bro].get(tk, 0) + 1
-
     state["brother_task_counts"] = brother_task_counts
-    state["brother_last_week_tasks"] = dict(this_week_tasks)
+    state["brother_last_week_tasks"] = {bro: dict(counts) for bro, counts in this_week_counts.items()}
 
     return schedule, state
@@ -1,9 +1,21 @@
 """Bonus third cleaning selection for flexible 2-3x/week tasks."""
 from typing import List, Dict, Any
 import hashlib
+import heapq
 from .models import TaskTemplate
 
 
+# Bonus priority by category: bathrooms > floors > common areas
+CATEGORY_PRIORITY = {
+    "bathrooms": 3,
+    "floors": 2,
+    "common": 1,
+    "k&m": 1,
+    "laundry": 0,
+    "other": 0
+}
+
+
 def week_capacity_allows_bonus(house_size: int, min_roster: int = 14) -> bool:
     """Check if roster size is large enough to support bonus 3rd cleanings."""
     return house_size >= min_roster
@@ -12,8 +24,9 @@ def week_capacity_allows_bonus(house_size: int, min_roster: int = 14) -> bool:
 def stable_int_from_strings(*parts: str) -> int:
     """Generate deterministic integer from string inputs for reproducible randomness."""
     combined = "|".join(str(p) for p in parts)
-    digest = hashlib.md5(combined.encode("utf-8")).hexdigest()
-    return int(digest[:8], 16)
+    # 32-bit BLAKE2b digest: cheaper than MD5 for short inputs and, unlike
+    # hash(), stable across processes and machines
+    return int.from_bytes(hashlib.blake2b(combined.encode("utf-8"), digest_size=4).digest(), "big")
 
 
 def choose_bonus_tasks_for_week(
@@ -48,28 +61,22 @@ def choose_bonus_tasks_for_week(
     if not eligible:
         return []
     
-    # Priority categories
-    category_priority = {
-        "bathrooms": 3,
-        "floors": 2,
-        "common": 1,
-        "k&m": 1,
-        "laundry": 0,
-        "other": 0
-    }
-    
-    # Sort by: priority desc, bonus_count asc, then stable hash
-    def sort_key(t: TaskTemplate):
-        priority = category_priority.get(t.category, 0)
-        count = bonus_counts.get(t.key, 0)
-        # Stable tie-breaker
-        seed_val = stable_int_from_strings(anchor_sunday, str(week_index), t.key, str(seed_offset))
-        return (-priority, count, seed_val)
-    
-    eligible.sort(key=sort_key)
+    # Decorate once: (priority desc, bonus_count asc, stable hash, key),
+    # so picking compares plain tuples instead of calling a key function
+    week = str(week_index)
+    offset = str(seed_offset)
+    decorated = [
+        (
+            -CATEGORY_PRIORITY.get(t.category, 0),
+            bonus_counts.get(t.key, 0),
+            stable_int_from_strings(anchor_sunday, week, t.key, offset),
+            t.key
+        )
+        for t in eligible
+    ]
     
-    # Select top 40% (minimum 1, maximum 3)
+    # Select top 40% (minimum 1, maximum 3); only the picks need ordering
     num_to_pick = max(1, min(3, len(eligible) * 2 // 5))
-    selected = [t.key for t in eligible[:num_to_pick]]
+    selected = [key for *_, key in heapq.nsmallest(num_to_pick, decorated)]
     
     return selected
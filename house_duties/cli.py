@@ -2,9 +2,10 @@
 import argparse
 import sys
 import logging
+from collections import Counter
 from pathlib import Path
 from datetime import date
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from .models import TaskTemplate, Occurrence
 from .utils import most_recent_sunday, parse_start_sunday
@@ -36,8 +37,8 @@ def configure_logging(verbose: bool = False, log_file: str = "house_duties.log")
     )
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command-line arguments."""
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments (defaults to sys.argv)."""
     parser = argparse.ArgumentParser(
         description="House Duties Scheduler - Fairness-based chore assignment system",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -140,7 +141,99 @@ File Paths:
         help='Suppress schedule output (still writes files)'
     )
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def generate_schedule(args: Optional[argparse.Namespace] = None) -> List[Dict[str, Any]]:
+    """
+    Generate the schedule, write the output files and return the schedule items.
+    
+    Importable entry point used by the Discord bot so it can run the scheduler
+    in-process instead of spawning a new interpreter.
+    
+    Raises:
+        FileNotFoundError, ValueError: on missing or invalid input files
+    """
+    if args is None:
+        args = parse_arguments([])
+    
+    logger = logging.getLogger(__name__)
+    
+    # Load roster and constraints
+    logger.info("Loading roster and configuration...")
+    brothers = load_brothers(args.brothers)
+    if not brothers:
+        raise ValueError("No brothers found in roster file")
+    logger.info(f"Loaded {len(brothers)} brothers")
+    
+    categories = load_categories(args.categories)
+    constraints = load_constraints(args.constraints)
+    
+    # Load persistent state
+    state = load_state(args.state)
+    
+    # Determine start Sunday
+    start_sunday = parse_start_sunday(args.start)
+    anchor_sunday = get_anchor_sunday(state, start_sunday)
+    logger.info(f"Anchor Sunday: {anchor_sunday}")
+    logger.info(f"Generating schedule starting: {start_sunday}")
+    logger.info(f"Generating {args.weeks} week(s)")
+    
+    # Build task templates
+    templates = build_templates()
+    logger.info(f"Built {len(templates)} task templates")
+    
+    # Expand to occurrences
+    bonus_counts = state.get("bonus_counts", {})
+    occurrences = occurrences_from_templates(
+        templates=templates,
+        start_sunday=start_sunday,
+        num_weeks=args.weeks,
+        anchor_sunday=anchor_sunday,
+        bonus_counts=bonus_counts,
+        roster_size=len(brothers),
+        min_bonus_roster=args.min_bonus_roster
+    )
+    logger.info(f"Expanded to {len(occurrences)} chore occurrences")
+    
+    # Assign brothers
+    logger.info("Assigning chores...")
+    schedule, updated_state = assign_chores(
+        occs=occurrences,
+        brothers=brothers,
+        constraints=constraints,
+        state=state,
+        random_seed=args.seed
+    )
+    logger.info(f"Assigned {len(schedule)} chores")
+    
+    # Update bonus counts for selected tasks (bonus labels end in " [BONUS]")
+    bonus_picks = Counter(occ.task_key for occ in occurrences if occ.task_label.endswith(" [BONUS]"))
+    if bonus_picks:
+        counts = updated_state.setdefault("bonus_counts", {})
+        for task_key, picks in bonus_picks.items():
+            counts[task_key] = counts.get(task_key, 0) + picks
+    
+    # Save outputs
+    if not args.dry_run:
+        save_state(args.state, updated_state)
+        logger.info(f"Saved state to {args.state}")
+    else:
+        logger.info("DRY RUN - State not saved")
+    
+    write_csv(schedule, args.output_csv)
+    write_json(schedule, args.output_json)
+    logger.info(f"Wrote schedule to {args.output_csv} and {args.output_json}")
+    
+    # Print schedule
+    if not args.quiet:
+        print("\n" + "="*80)
+        print(f"HOUSE DUTIES SCHEDULE - Week of {start_sunday}")
+        print("="*80 + "\n")
+        print_schedule_by_deck(schedule, start_sunday, anchor_sunday, len(brothers))
+    
+    logger.info("Schedule generation completed successfully")
+    return schedule
 
 
 def main(args: Optional[argparse.Namespace] = None) -> int:
@@ -157,81 +250,7 @@ def main(args: Optional[argparse.Namespace] = None) -> int:
     logger = logging.getLogger(__name__)
     
     try:
-        # Load roster and constraints
-        logger.info("Loading roster and configuration...")
-        brothers = load_brothers(args.brothers)
-        if not brothers:
-            logger.error("No brothers found in roster file")
-            return 1
-        logger.info(f"Loaded {len(brothers)} brothers")
-        
-        categories = load_categories(args.categories)
-        constraints = load_constraints(args.constraints)
-        
-        # Load persistent state
-        state = load_state(args.state)
-        
-        # Determine start Sunday
-        start_sunday = parse_start_sunday(args.start)
-        anchor_sunday = get_anchor_sunday(state, start_sunday)
-        logger.info(f"Anchor Sunday: {anchor_sunday}")
-        logger.info(f"Generating schedule starting: {start_sunday}")
-        logger.info(f"Generating {args.weeks} week(s)")
-        
-        # Build task templates
-        templates = build_templates()
-        logger.info(f"Built {len(templates)} task templates")
-        
-        # Expand to occurrences
-        bonus_counts = state.get("bonus_counts", {})
-        occurrences = occurrences_from_templates(
-            templates=templates,
-            start_sunday=start_sunday,
-            num_weeks=args.weeks,
-            anchor_sunday=anchor_sunday,
-            bonus_counts=bonus_counts,
-            roster_size=len(brothers),
-            min_bonus_roster=args.min_bonus_roster
-        )
-        logger.info(f"Expanded to {len(occurrences)} chore occurrences")
-        
-        # Assign brothers
-        logger.info("Assigning chores...")
-        schedule, updated_state = assign_chores(
-            occs=occurrences,
-            brothers=brothers,
-            constraints=constraints,
-            state=state,
-            random_seed=args.seed
-        )
-        logger.info(f"Assigned {len(schedule)} chores")
-        
-        # Update bonus counts for selected tasks
-        for occ in occurrences:
-            if "[BONUS]" in occ.task_label:
-                task_key = occ.task_key
-                updated_state.setdefault("bonus_counts", {})
-                updated_state["bonus_counts"][task_key] = updated_state["bonus_counts"].get(task_key, 0) + 1
-        
-        # Save outputs
-        if not args.dry_run:
-            save_state(args.state, updated_state)
-            logger.info(f"Saved state to {args.state}")
-        else:
-            logger.info("DRY RUN - State not saved")
-        
-        write_csv(schedule, args.output_csv)
-        write_json(schedule, args.output_json)
-        logger.info(f"Wrote schedule to {args.output_csv} and {args.output_json}")
-        
-        # Print schedule
-        if not args.quiet:
-            print("\n" + "="*80)
-            print(f"HOUSE DUTIES SCHEDULE - Week of {start_sunday}")
-            print("="*80 + "\n")
-            print_schedule_by_deck(schedule, start_sunday, anchor_sunday, len(brothers))
-        
-        logger.info("Schedule generation completed successfully")
+        generate_schedule(args)
         return 0
         
     except FileNotFoundError as e:
@@ -21,9 +21,15 @@ class TaskTemplate:
     flexible_2_3x: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class Occurrence:
     """A specific instance of a task on a particular date."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10): no per-instance __dict__
+    __slots__ = (
+        "task_key", "task_label", "deck", "category",
+        "people_needed", "due_dt", "week_index", "weight"
+    )
+    
     task_key: str
     task_label: str
     deck: str
@@ -1,43 +1,49 @@
 """Output formatting for schedules (CSV, JSON, terminal display)."""
 import csv
-import json
 import logging
-from datetime import date, datetime
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Dict, Any
 
+from .utils import atomic_write_bytes, json_dumps
+
 logger = logging.getLogger(__name__)
 
 # Deck ordering for display
 DECK_ORDER = ["Zero Deck", "First Deck", "Second Deck", "Third Deck", "Other"]
+_DECK_RANK = {deck: i for i, deck in enumerate(DECK_ORDER)}
+
+CSV_HEADERS = ("due", "deck", "task_key", "task", "category", "people_needed", "assigned", "weight_total")
 
 
 def write_csv(schedule_items: List[Dict[str, Any]], filepath: str):
     """Write schedule to CSV file with error handling."""
     try:
-        rows = []
-        for item in schedule_items:
-            # Parse due datetime from ISO string
-            due_dt = datetime.fromisoformat(item["due"])
-            rows.append({
-                "due": due_dt.strftime("%Y-%m-%d %H:%M"),
-                "deck": item["deck"],
-                "task_key": item["task_key"],
-                "task": item["task"],
-                "category": item["category"],
-                "people_needed": item["people_needed"],
-                "assigned": ", ".join(item["assigned"]),
-                "weight_total": round(item["weight_total"], 2)
-            })
-        rows.sort(key=lambda x: (DECK_ORDER.index(x["deck"]) if x["deck"] in DECK_ORDER else 999, x["due"]))
+        # Sort the items themselves (by deck, then due minute) and format
+        # each row as it's written, so no second list of rows is built
+        items = sorted(schedule_items, key=lambda item: (_DECK_RANK.get(item["deck"], 999), item["due"][:16]))
         
         with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                "due", "deck", "task_key", "task", "category", "people_needed", "assigned", "weight_total"
-            ])
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADERS)
+            # Rows in CSV_HEADERS order. "due" is already ISO 8601, so
+            # "YYYY-MM-DD HH:MM" is a slice of it rather than a parse/format
+            writer.writerows(
+                (
+                    f"{item['due'][:10]} {item['due'][11:16]}",
+                    item["deck"],
+                    item["task_key"],
+                    item["task"],
+                    item["category"],
+                    item["people_needed"],
+                    ", ".join(item["assigned"]),
+                    round(item["weight_total"], 2)
+                )
+                for item in items
+            )
         
-        logger.info(f"Wrote {len(rows)} schedule items to '{filepath}'")
+        logger.info(f"Wrote {len(items)} schedule items to '{filepath}'")
     
     except Exception as e:
         logger.error(f"Error writing CSV to '{filepath}': {e}")
@@ -47,8 +53,7 @@ def write_csv(schedule_items: List[Dict[str, Any]], filepath: str):
 def write_json(schedule_items: List[Dict[str, Any]], filepath: str):
     """Write schedule to JSON file with error handling."""
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(schedule_items, f, indent=2)
+        atomic_write_bytes(filepath, json_dumps(schedule_items))
         
         logger.info(f"Wrote {len(schedule_items)} schedule items to '{filepath}'")
     
@@ -67,43 +72,39 @@ def print_schedule_by_deck(schedule_items: List[Dict[str, Any]],
     week_index = week_index_from_anchor(anchor_sunday, current_sunday)
     parity = "EVEN" if week_index % 2 == 0 else "ODD"
     
-    print("\n" + "=" * 60)
-    print("HOUSE DUTIES SCHEDULE")
-    print("=" * 60)
-    print(f"Week: {current_sunday} (Sun) -> {current_sunday + __import__('datetime').timedelta(days=6)} (Sat)")
-    print(f"Roster size: {house_size} brothers")
-    print(f"Biweekly parity: week_index={week_index} | {parity}")
-    print("=" * 60)
+    lines: List[str] = []
+    add = lines.append
     
-    # Group by day then by deck
-    by_day: Dict[date, Dict[str, List[Dict[str, Any]]]] = {}
-    for item in schedule_items:
-        day = datetime.fromisoformat(item["due"]).date()
-        if day not in by_day:
-            by_day[day] = {}
-        deck = item["deck"]
-        if deck not in by_day[day]:
-            by_day[day][deck] = []
-        by_day[day][deck].append(item)
+    add("\n" + "=" * 60)
+    add("HOUSE DUTIES SCHEDULE")
+    add("=" * 60)
+    add(f"Week: {current_sunday} (Sun) -> {current_sunday + __import__('datetime').timedelta(days=6)} (Sat)")
+    add(f"Roster size: {house_size} brothers")
+    add(f"Biweekly parity: week_index={week_index} | {parity}")
+    add("=" * 60)
     
-    for day in sorted(by_day.keys()):
-        dow_name = DOW[day.weekday() if day.weekday() != 6 else 0] if day.weekday() == 6 else DOW[(day.weekday() + 1) % 7]
-        print(f"\n\n**{dow_name} {day}**")
-        print("-" * 60)
-        
-        decks_this_day = by_day[day]
-        # Sort decks by DECK_ORDER
-        sorted_decks = sorted(decks_this_day.keys(), 
-                            key=lambda d: DECK_ORDER.index(d) if d in DECK_ORDER else 999)
+    # One stable sort by day then deck, so each group is a contiguous run
+    # and tasks keep their schedule order within a deck
+    items = sorted(schedule_items, key=lambda item: (
+        item["due"][:10], _DECK_RANK.get(item["deck"], 999), item["deck"]
+    ))
+    
+    for date_str, day_items in groupby(items, key=lambda item: item["due"][:10]):
+        day = date.fromisoformat(date_str)
+        dow_name = DOW[(day.weekday() + 1) % 7]  # weekday() is Mon=0; DOW starts on Sunday
+        add(f"\n\n**{dow_name} {day}**")
+        add("-" * 60)
         
-        for deck in sorted_decks:
-            print(f"\n\n  {deck}:")
-            tasks = decks_this_day[deck]
+        for deck, tasks in groupby(day_items, key=itemgetter("deck")):
+            add(f"\n\n  {deck}:")
             for task in tasks:
                 assigned_str = ", ".join(task["assigned"])
                 people_count = len(task["assigned"])
-                print(f"    - {task['task']}")
-                print(f"      > Assigned: {assigned_str} ({people_count} person{'s' if people_count != 1 else ''})")
-                print()
+                add(f"    - {task['task']}")
+                add(f"      > Assigned: {assigned_str} ({people_count} person{'s' if people_count != 1 else ''})")
+                add("")
+    
+    add("\n" + "=" * 60 + "\n")
     
-    print("\n" + "=" * 60 + "\n")
+    # Emit the whole schedule in one write rather than a print() per line
+    print("\n".join(lines))
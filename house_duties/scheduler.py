@@ -44,11 +44,41 @@ def occurrences_from_templates(
     if bonus_third_day is None:
         bonus_third_day = [5]  # Friday
     
+    bonus_days = unique_sorted_days(bonus_third_day)
+    if any(not 0 <= dow <= 6 for dow in bonus_days):
+        raise ValueError(f"Bonus day(s) {bonus_days} must be weekday indices 0-6 (0=Sun)")
+    
+    # Which weekdays each template falls on doesn't depend on the week, so
+    # work out its (day, label) slots, its bonus slots and its weight once
+    template_slots = []
+    for tmpl in templates:
+        if tmpl.cadence in ("weekly", "biweekly"):
+            days = unique_sorted_days(tmpl.days_of_week) if tmpl.days_of_week else []
+        elif tmpl.cadence == "n_per_week" and tmpl.preferred_days and tmpl.times_per_week:
+            # Base occurrences (usually 2x/week)
+            days = unique_sorted_days(tmpl.preferred_days[:tmpl.times_per_week])
+        else:
+            days = []
+        if not days:
+            continue
+        if any(not 0 <= dow <= 6 for dow in days):
+            raise ValueError(f"Task template '{tmpl.key}' has day(s) {days}; weekdays must be 0-6 (0=Sun)")
+        slots = [(dow, tmpl.label) for dow in days]
+        # Bonus 3rd occurrence days, skipping days already scheduled
+        bonus_slots = []
+        if tmpl.cadence == "n_per_week":
+            bonus_slots = [(dow, tmpl.label + " [BONUS]") for dow in bonus_days if dow not in days]
+        template_slots.append((tmpl, slots, bonus_slots, tmpl.severity * tmpl.effort_multiplier))
+    # Biweekly tasks run on even weeks only
+    odd_week_slots = [t for t in template_slots if t[0].cadence != "biweekly"]
+    
     all_occs = []
     
     for week_idx in range(num_weeks):
         week_start = week_start_for(start_sunday, week_idx)
         abs_week_idx = week_index_from_anchor(anchor_sunday, week_start)
+        # Every task is due at the same time of day, so build each day's due datetime once
+        due_dts = [dt_on(week_start, dow, DEFAULT_DUE_TIME) for dow in range(7)]
         
         # Determine bonus tasks for this week
         bonus_task_keys = choose_bonus_tasks_for_week(
@@ -60,81 +90,21 @@ def occurrences_from_templates(
             min_roster=min_bonus_roster
         )
         
-        for tmpl in templates:
-            weight = tmpl.severity * tmpl.effort_multiplier
-            
-            # ----- Weekly cadence -----
-            if tmpl.cadence == "weekly":
-                if not tmpl.days_of_week:
-                    continue
-                for dow in unique_sorted_days(tmpl.days_of_week):
-                    due_dt = dt_on(week_start, dow, DEFAULT_DUE_TIME)
-                    all_occs.append(Occurrence(
-                        task_key=tmpl.key,
-                        task_label=tmpl.label,
-                        deck=tmpl.deck,
-                        category=tmpl.category,
-                        people_needed=tmpl.people_needed,
-                        due_dt=due_dt,
-                        week_index=abs_week_idx,
-                        weight=weight
-                    ))
+        # Bucket by weekday: every task on a day shares its due datetime, so
+        # concatenating the buckets (weeks come in order) sorts by due date
+        # while keeping template order within a day, with no sort pass
+        day_occs = [[] for _ in range(7)]
+        for tmpl, slots, bonus_slots, weight in (odd_week_slots if abs_week_idx % 2 else template_slots):
+            if bonus_slots and tmpl.key in bonus_task_keys:
+                slots = slots + bonus_slots
             
-            # ----- Biweekly cadence -----
-            elif tmpl.cadence == "biweekly":
-                if abs_week_idx % 2 == 0:  # Even weeks only (or adjust logic as needed)
-                    if not tmpl.days_of_week:
-                        continue
-                    for dow in unique_sorted_days(tmpl.days_of_week):
-                        due_dt = dt_on(week_start, dow, DEFAULT_DUE_TIME)
-                        all_occs.append(Occurrence(
-                            task_key=tmpl.key,
-                            task_label=tmpl.label,
-                            deck=tmpl.deck,
-                            category=tmpl.category,
-                            people_needed=tmpl.people_needed,
-                            due_dt=due_dt,
-                            week_index=abs_week_idx,
-                            weight=weight
-                        ))
-            
-            # ----- N per week cadence -----
-            elif tmpl.cadence == "n_per_week":
-                if not tmpl.preferred_days or not tmpl.times_per_week:
-                    continue
-                
-                # Base occurrences (usually 2x/week)
-                base_days = unique_sorted_days(tmpl.preferred_days[:tmpl.times_per_week])
-                for dow in base_days:
-                    due_dt = dt_on(week_start, dow, DEFAULT_DUE_TIME)
-                    all_occs.append(Occurrence(
-                        task_key=tmpl.key,
-                        task_label=tmpl.label,
-                        deck=tmpl.deck,
-                        category=tmpl.category,
-                        people_needed=tmpl.people_needed,
-                        due_dt=due_dt,
-                        week_index=abs_week_idx,
-                        weight=weight
-                    ))
-                
-                # Bonus 3rd occurrence if selected
-                if tmpl.key in bonus_task_keys:
-                    for dow in unique_sorted_days(bonus_third_day):
-                        # Skip if already scheduled on this day
-                        if dow not in base_days:
-                            due_dt = dt_on(week_start, dow, DEFAULT_DUE_TIME)
-                            all_occs.append(Occurrence(
-                                task_key=tmpl.key,
-                                task_label=tmpl.label + " [BONUS]",
-                                deck=tmpl.deck,
-                                category=tmpl.category,
-                                people_needed=tmpl.people_needed,
-                                due_dt=due_dt,
-                                week_index=abs_week_idx,
-                                weight=weight
-                            ))
+            for dow, label in slots:
+                # Positional args in Occurrence field order: keyword dispatch
+                # roughly doubles the constructor cost on this hot path
+                day_occs[dow].append(Occurrence(tmpl.key, label, tmpl.deck, tmpl.category,
+                                                tmpl.people_needed, due_dts[dow], abs_week_idx, weight))
+        
+        for occs in day_occs:
+            all_occs.extend(occs)
     
-    # Sort by due date
-    all_occs.sort(key=lambda o: o.due_dt)
     return all_occs
@@ -2,11 +2,18 @@
 import json
 import logging
 import os
+import shutil
 from datetime import date
 from typing import Dict, List, Any
 
+from .utils import atomic_write_bytes, json_loads, json_dumps
+
 logger = logging.getLogger(__name__)
 
+# Characters allowed in roster names besides letters/digits, stripped in
+# one pass before the isalnum() check
+_NAME_PUNCTUATION = str.maketrans("", "", " -'")
+
 
 def load_state(filepath: str) -> Dict[str, Any]:
     """Load persistent state from JSON file with error handling."""
@@ -14,11 +21,11 @@ def load_state(filepath: str) -> Dict[str, Any]:
         logger.info(f"State file '{filepath}' not found. Starting with empty state.")
         return {}
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            state = json.load(f)
+        with open(filepath, "rb") as f:
+            state = json_loads(f.read())
             logger.info(f"Loaded state from '{filepath}'")
             return state
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         logger.error(f"Invalid JSON in state file '{filepath}': {e}")
         logger.warning("Starting with empty state. Previous state will be backed up.")
         # Backup corrupted file
@@ -45,17 +52,14 @@ def save_state(filepath: str, state: Dict[str, Any]) -> None:
         if os.path.exists(filepath):
             backup_path = f"{filepath}.bak"
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    backup_state = json.load(f)
-                with open(backup_path, "w", encoding="utf-8") as f:
-                    json.dump(backup_state, f, indent=2)
+                # Byte copy: no need to parse and re-serialize the old state
+                shutil.copyfile(filepath, backup_path)
                 logger.debug(f"Created backup at '{backup_path}'")
             except Exception as e:
                 logger.warning(f"Could not create backup: {e}")
         
-        # Write new state
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        # Write new state (atomically, so a crash can't truncate it)
+        atomic_write_bytes(filepath, json_dumps(state))
         logger.info(f"Saved state to '{filepath}'")
     except Exception as e:
         logger.error(f"Error saving state to '{filepath}': {e}")
@@ -81,33 +85,30 @@ def load_brothers(filepath: str) -> List[str]:
         )
     
     try:
-        brothers: List[str] = []
         with open(filepath, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                name = line.strip()
-                if name and not name.startswith("#"):
-                    # Validate name
-                    if len(name) > 100:
-                        logger.warning(f"Line {line_num}: Name too long (truncating): {name[:50]}...")
-                        name = name[:100]
-                    if not name.replace(' ', '').replace('-', '').replace("'", '').isalnum():
-                        logger.warning(f"Line {line_num}: Name contains unusual characters: {name}")
-                    brothers.append(name)
+            lines = f.read().splitlines()
+        
+        # Dict keys keep first-seen order, so duplicates drop out as we go
+        brothers: Dict[str, None] = {}
+        for line_num, line in enumerate(lines, 1):
+            name = line.strip()
+            if name and not name.startswith("#"):
+                # Validate name
+                if len(name) > 100:
+                    logger.warning(f"Line {line_num}: Name too long (truncating): {name[:50]}...")
+                    name = name[:100]
+                if not name.translate(_NAME_PUNCTUATION).isalnum():
+                    logger.warning(f"Line {line_num}: Name contains unusual characters: {name}")
+                if name in brothers:
+                    logger.warning(f"Duplicate brother name removed: {name}")
+                else:
+                    brothers[name] = None
         
         if not brothers:
             logger.error(f"Roster file '{filepath}' is empty or contains only comments")
             raise ValueError("Roster file is empty. Add at least one brother name.")
         
-        # Remove duplicates while preserving order
-        seen = set()
-        out = []
-        for b in brothers:
-            if b not in seen:
-                out.append(b)
-                seen.add(b)
-            else:
-                logger.warning(f"Duplicate brother name removed: {b}")
-        
+        out = list(brothers)
         logger.info(f"Loaded {len(out)} brothers from '{filepath}'")
         return out
     
@@ -126,8 +127,8 @@ def load_categories(filepath: str) -> Dict[str, List[str]]:
         return {"actives": [], "junior_actives": []}
     
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = json_loads(f.read())
         
         # Validate structure
         if not isinstance(data, dict):
@@ -164,22 +165,31 @@ DEFAULT_CONSTRAINTS = {
 }
 
 
+def _default_constraints() -> Dict[str, Any]:
+    """Fresh copy of DEFAULT_CONSTRAINTS whose lists/dicts aren't shared with it."""
+    return {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in DEFAULT_CONSTRAINTS.items()
+    }
+
+
 def load_constraints(filepath: str) -> Dict[str, Any]:
     """Load constraints file with validation and error handling."""
     if not os.path.exists(filepath):
         logger.debug(f"Constraints file '{filepath}' not found. Using defaults.")
-        return DEFAULT_CONSTRAINTS.copy()
+        return _default_constraints()
     
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = json_loads(f.read())
         
         if not isinstance(data, dict):
             logger.warning(f"Invalid constraints format. Expected dict, got {type(data)}")
-            return DEFAULT_CONSTRAINTS.copy()
+            return _default_constraints()
         
-        merged = DEFAULT_CONSTRAINTS.copy()
-        merged.update(data or {})
+        # Keys missing from the file keep their (unshared) defaults
+        merged = _default_constraints()
+        merged.update(data)
         
         # Validate numeric constraints
         for key in ['max_per_brother_per_week', 'max_per_brother_per_day', 'min_per_brother_per_week']:
@@ -199,7 +209,7 @@ def load_constraints(filepath: str) -> Dict[str, Any]:
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in constraints file '{filepath}': {e}")
         logger.warning("Using default constraints")
-        return DEFAULT_CONSTRAINTS.copy()
+        return _default_constraints()
     except Exception as e:
         logger.error(f"Error loading constraints from '{filepath}': {e}")
-        return DEFAULT_CONSTRAINTS.copy()
+        return _default_constraints()
@@ -1,6 +1,24 @@
-"""Date and time utility functions."""
+"""Date, time and file utility functions."""
+import json
+import os
+import stat
 from datetime import date, datetime, timedelta, time
-from typing import List
+from typing import Any, List
+
+# json_loads/json_dumps use orjson when it is installed, else the stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj as 2-space indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # Optional speedup; fall back to the stdlib parser/serializer
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj as 2-space indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 
 DOW = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
@@ -37,3 +55,50 @@ def unique_sorted_days(days: List[int]) -> List[int]:
 def week_index_from_anchor(anchor_sunday: date, current_sunday: date) -> int:
     """Calculate week index from anchor Sunday (for biweekly parity)."""
     return (current_sunday - anchor_sunday).days // 7
+
+
+# Flags for creating a fresh temp file; O_BINARY only exists (and matters) on Windows
+_TMP_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+
+def _create_temp_beside(filepath: str):
+    """
+    Create a new temp file next to filepath and return (fd, path).
+    
+    Unlike mkstemp (always 0600) the file is opened with mode 0o666, so
+    the kernel applies the process umask just as a plain open() would.
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    prefix = f".{os.path.basename(filepath)}."
+    while True:
+        tmp_path = os.path.join(directory, f"{prefix}{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def atomic_write_bytes(filepath: str, data: bytes) -> None:
+    """
+    Write data to filepath atomically.
+    
+    The bytes go to a temporary file in the same directory, which then
+    replaces filepath, so readers (e.g. the Discord bot) never see a
+    half-written file and a failed write leaves the old file intact.
+    An existing file keeps its mode; a new one gets the umask default.
+    """
+    fd, tmp_path = _create_temp_beside(filepath)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(filepath).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,80 @@
+"""Tests for Discord schedule message building."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+discord = pytest.importorskip("discord")
+
+from discord_bot.scheduler import to_schedule_items
+from discord_bot.embeds import (
+    create_schedule_messages,
+    group_by_deck,
+    MAX_EMBEDS_PER_MESSAGE
+)
+
+
+def make_items(date_str, count, deck="First Deck", task="k&m"):
+    """Build count schedule items due on date_str."""
+    return to_schedule_items([
+        {"due": f"{date_str}T23:59:00", "deck": deck, "task": task, "assigned": ["Alex", "Bob"]}
+        for _ in range(count)
+    ])
+
+
+class TestGroupByDeck:
+    """Test deck bucketing."""
+
+    @pytest.mark.unit
+    def test_unknown_deck_goes_to_other(self):
+        """Test decks outside DECK_ORDER land in the last (Other) bucket."""
+        items = make_items("2026-01-18", 1, deck="Basement")
+        groups = group_by_deck(items)
+        assert groups[-1] == items
+        assert not any(groups[:-1])
+
+
+class TestScheduleMessages:
+    """Test packing a schedule into Discord messages."""
+
+    @pytest.mark.unit
+    def test_week_fits_in_one_message(self):
+        """Test header, seven days and footer are sent as one message."""
+        items = []
+        for day in range(18, 25):
+            items += make_items(f"2026-01-{day}", 3)
+        messages = create_schedule_messages(items)
+        assert len(messages) == 1
+        assert len(messages[0]["embeds"]) == 9
+
+    @pytest.mark.unit
+    def test_day_fields_follow_deck_order(self):
+        """Test a day's fields are ordered by deck with unknown decks under Other."""
+        items = make_items("2026-01-18", 1, deck="Basement")
+        items += make_items("2026-01-18", 1, deck="Second Deck")
+        items += make_items("2026-01-18", 1, deck="Zero Deck")
+        day_embed = create_schedule_messages(items)[0]["embeds"][1]
+        assert [f.name for f in day_embed.fields] == ["Zero Deck", "Second Deck", "Other"]
+
+    @pytest.mark.unit
+    def test_embed_count_limit(self):
+        """Test no message carries more than Discord's embed limit."""
+        items = []
+        for day in range(1, 29):
+            items += make_items(f"2026-02-{day:02d}", 1)
+        messages = create_schedule_messages(items)
+        assert all(len(m["embeds"]) <= MAX_EMBEDS_PER_MESSAGE for m in messages)
+        assert sum(len(m["embeds"]) for m in messages) == 30
+
+    @pytest.mark.unit
+    def test_oversized_day_becomes_attachment(self):
+        """Test a day too large for an embed is sent as a markdown file, in order."""
+        items = make_items("2026-01-18", 1)
+        items += make_items("2026-01-19", 300, task="a fairly long task name " * 3)
+        items += make_items("2026-01-20", 1)
+        messages = create_schedule_messages(items)
+
+        assert [("file" in m) for m in messages] == [False, True, False]
+        assert messages[1]["file"].filename == "2026-01-19.md"
+        assert "Monday" in messages[1]["content"]
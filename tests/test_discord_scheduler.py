@@ -0,0 +1,262 @@
+"""Tests for the Discord bot's schedule loading helpers (no discord.py needed)."""
+import pytest
+import sys
+import os
+import json
+import asyncio
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord_bot.scheduler import (
+    ScheduleItem,
+    to_schedule_items,
+    build_schedule_index,
+    next_sunday_run,
+    load_schedule,
+    load_schedule_index,
+    invalidate_schedule_cache,
+    schedule_digest,
+    last_posted_digest,
+    record_posted_digest,
+    retry_backoff,
+    run_scheduler_with_retry,
+    MAX_RETRY_DELAY
+)
+
+
+@pytest.fixture
+def sample_schedule():
+    """Schedule items in the format written by house_duties.output.write_json."""
+    return [
+        {"due": "2026-01-18T23:59:00", "deck": "First Deck", "task": "k&m", "assigned": ["Alex", "Bob"]},
+        {"due": "2026-01-18T23:59:00", "deck": "Zero Deck", "task": "Laundry", "assigned": ["Charlie"]},
+        {"due": "2026-01-20T23:59:00", "deck": "First Deck", "task": "k&m", "assigned": ["Alex"]},
+    ]
+
+
+@pytest.fixture
+def sample_schedule_file(temp_dir, sample_schedule):
+    """Create a sample schedule.json file."""
+    schedule_file = temp_dir / "schedule.json"
+    schedule_file.write_text(json.dumps(sample_schedule))
+    return schedule_file
+
+
+class TestScheduleItems:
+    """Test conversion of schedule dicts into records."""
+
+    @pytest.mark.unit
+    def test_to_schedule_items(self, sample_schedule):
+        """Test items keep the displayed fields with assigned as a tuple."""
+        items = to_schedule_items(sample_schedule)
+        assert items[0] == ScheduleItem(
+            "2026-01-18T23:59:00", "First Deck", "k&m", ("Alex", "Bob"), "Alex, Bob", "2026-01-18"
+        )
+        assert items[0].assigned == ("Alex", "Bob")
+        assert items[1].assigned_display == "Charlie"
+
+    @pytest.mark.unit
+    def test_extra_keys_ignored(self):
+        """Test keys the bot doesn't display (task_key, weight_total...) are dropped."""
+        raw = [{"due": "2026-01-18T23:59:00", "deck": "Other", "task": "Trash",
+                "task_key": "trash", "weight_total": 2, "assigned": ["Alex"]}]
+        assert to_schedule_items(raw)[0].task == "Trash"
+
+
+class TestScheduleIndex:
+    """Test schedule indexing."""
+
+    @pytest.mark.unit
+    def test_index_by_member(self, sample_schedule):
+        """Test items are indexed under every assigned member."""
+        index = build_schedule_index(to_schedule_items(sample_schedule))
+        assert [i.date for i in index.by_member["Alex"]] == ["2026-01-18", "2026-01-20"]
+        assert len(index.by_member["Bob"]) == 1
+        assert "Dave" not in index.by_member
+
+    @pytest.mark.unit
+    def test_index_by_date_uses_iso_prefix(self, sample_schedule):
+        """Test dates are keyed as YYYY-MM-DD regardless of the time part."""
+        index = build_schedule_index(to_schedule_items(sample_schedule))
+        assert sorted(index.by_date) == ["2026-01-18", "2026-01-20"]
+        assert len(index.by_date["2026-01-18"]) == 2
+
+    @pytest.mark.unit
+    def test_index_by_deck(self, sample_schedule):
+        """Test items are grouped by deck."""
+        index = build_schedule_index(to_schedule_items(sample_schedule))
+        assert len(index.by_deck["First Deck"]) == 2
+        assert len(index.by_deck["Zero Deck"]) == 1
+
+
+class TestLoadSchedule:
+    """Test schedule file loading and caching."""
+
+    @pytest.mark.integration
+    def test_load_missing_file(self, temp_dir):
+        """Test loading a missing schedule returns None."""
+        assert asyncio.run(load_schedule(str(temp_dir / "missing.json"))) is None
+
+    @pytest.mark.integration
+    def test_load_invalid_json(self, temp_dir):
+        """Test loading invalid JSON returns None."""
+        bad_file = temp_dir / "schedule.json"
+        bad_file.write_text("{ not json")
+        assert asyncio.run(load_schedule(str(bad_file))) is None
+
+    @pytest.mark.integration
+    def test_load_is_cached_until_file_changes(self, sample_schedule_file, sample_schedule):
+        """Test repeated loads reuse the parsed data until the file is rewritten."""
+        first = asyncio.run(load_schedule(str(sample_schedule_file)))
+        second = asyncio.run(load_schedule(str(sample_schedule_file)))
+        assert first == to_schedule_items(sample_schedule)
+        assert first is second
+
+        sample_schedule_file.write_text(json.dumps(sample_schedule[:1]))
+        stat = sample_schedule_file.stat()
+        os.utime(sample_schedule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = asyncio.run(load_schedule(str(sample_schedule_file)))
+        assert len(third) == 1
+
+    @pytest.mark.integration
+    def test_invalidate_forces_reload(self, sample_schedule_file):
+        """Test invalidating the cache re-reads an unchanged file."""
+        first = asyncio.run(load_schedule(str(sample_schedule_file)))
+        invalidate_schedule_cache()
+        second = asyncio.run(load_schedule(str(sample_schedule_file)))
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.integration
+    def test_concurrent_loads_share_one_read(self, sample_schedule_file, monkeypatch):
+        """Test loads racing on a cold cache parse the file once."""
+        import discord_bot.scheduler as scheduler
+        reads = []
+        real_read = scheduler._read_schedule
+        monkeypatch.setattr(scheduler, "_read_schedule", lambda path: reads.append(path) or real_read(path))
+        invalidate_schedule_cache()
+
+        async def load_many():
+            return await asyncio.gather(*(load_schedule(str(sample_schedule_file)) for _ in range(5)))
+
+        results = asyncio.run(load_many())
+        assert len(reads) == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.integration
+    def test_index_is_reused_for_cached_data(self, sample_schedule_file):
+        """Test the index is built once per parse."""
+        first = asyncio.run(load_schedule_index(str(sample_schedule_file)))
+        second = asyncio.run(load_schedule_index(str(sample_schedule_file)))
+        assert first is second
+
+
+class TestScheduleDigest:
+    """Test duplicate-post detection."""
+
+    @pytest.mark.integration
+    def test_digest_roundtrip(self, sample_schedule_file, temp_dir):
+        """Test a recorded digest matches the same file contents."""
+        hash_file = str(temp_dir / ".schedule.hash")
+        digest = schedule_digest(str(sample_schedule_file))
+
+        assert last_posted_digest(hash_file) is None
+        record_posted_digest(digest, hash_file)
+        assert last_posted_digest(hash_file) == digest
+
+    @pytest.mark.integration
+    def test_digest_changes_with_contents(self, sample_schedule_file):
+        """Test the digest changes when the schedule changes."""
+        before = schedule_digest(str(sample_schedule_file))
+        sample_schedule_file.write_text("[]")
+        assert schedule_digest(str(sample_schedule_file)) != before
+
+    @pytest.mark.unit
+    def test_digest_missing_file(self, temp_dir):
+        """Test a missing schedule has no digest."""
+        assert schedule_digest(str(temp_dir / "missing.json")) is None
+
+
+class TestNextSundayRun:
+    """Test weekly run time calculation."""
+
+    @pytest.mark.unit
+    def test_midweek_goes_to_coming_sunday(self):
+        """Test a weekday resolves to the following Sunday."""
+        after = datetime(2026, 1, 14, 9, 30)  # Wednesday
+        assert next_sunday_run(20, 0, after) == datetime(2026, 1, 18, 20, 0)
+
+    @pytest.mark.unit
+    def test_sunday_before_run_time_is_same_day(self):
+        """Test Sunday before the run time resolves to that day."""
+        after = datetime(2026, 1, 18, 8, 0)
+        assert next_sunday_run(20, 0, after) == datetime(2026, 1, 18, 20, 0)
+
+    @pytest.mark.unit
+    def test_exact_run_time_goes_to_next_week(self):
+        """Test the result is strictly after the given time."""
+        after = datetime(2026, 1, 18, 20, 0)
+        assert next_sunday_run(20, 0, after) == datetime(2026, 1, 25, 20, 0)
+
+    @pytest.mark.unit
+    def test_saturday_night(self):
+        """Test Saturday resolves to the next day."""
+        after = datetime(2026, 1, 17, 23, 59)
+        assert next_sunday_run(0, 5, after) == datetime(2026, 1, 18, 0, 5)
+
+    @pytest.mark.unit
+    def test_keeps_timezone(self):
+        """Test an aware (UTC) time resolves to a run time in the same zone."""
+        after = datetime(2026, 1, 14, 9, 30, tzinfo=timezone.utc)
+        assert next_sunday_run(8, 0, after) == datetime(2026, 1, 18, 8, 0, tzinfo=timezone.utc)
+
+
+class TestRetryBackoff:
+    """Test retry delay calculation."""
+
+    @pytest.mark.unit
+    def test_delay_doubles_per_attempt(self):
+        """Test the delay grows exponentially within the jitter band."""
+        for attempt, expected in [(1, 5), (2, 10), (3, 20)]:
+            delay = retry_backoff(attempt, 5)
+            assert expected * 0.75 <= delay <= expected * 1.25
+
+    @pytest.mark.unit
+    def test_delay_is_capped(self):
+        """Test large attempts never exceed the cap plus jitter."""
+        assert retry_backoff(20, 5) <= MAX_RETRY_DELAY * 1.25
+
+
+class TestInProcessRun:
+    """Test in-process scheduler runs don't overlap."""
+
+    @pytest.mark.integration
+    def test_timed_out_run_is_not_retried_or_overlapped(self, monkeypatch):
+        """Test a timeout isn't retried and no new run starts while the old thread lives."""
+        import threading
+        import discord_bot.scheduler as scheduler
+        release = threading.Event()
+        calls = []
+
+        def slow_generate(args):
+            calls.append(args)
+            release.wait(5)
+            return []
+
+        monkeypatch.setattr(scheduler, "generate_schedule", slow_generate)
+        monkeypatch.setattr(scheduler, "SCHEDULER_TIMEOUT", 0.05)
+        monkeypatch.setattr(scheduler, "_in_process_run", None)
+
+        async def scenario():
+            first = await run_scheduler_with_retry("python", "unused.py", retry_delay=0)
+            second = await run_scheduler_with_retry("python", "unused.py", retry_delay=0)
+            release.set()
+            await scheduler._in_process_run
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first[0] is False and "timed out" in first[1]
+        assert second[0] is False and "still in progress" in second[1]
+        assert len(calls) == 1
+        assert not scheduler.in_process_run_active()
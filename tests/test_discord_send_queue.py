@@ -0,0 +1,127 @@
+"""Tests for the paced Discord send queue."""
+import pytest
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+discord = pytest.importorskip("discord")
+
+from discord_bot.send_queue import SendQueue, MAX_SEND_ATTEMPTS
+
+
+class FakeResponse:
+    """Minimal aiohttp-like response for building HTTPExceptions."""
+
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.reason = "test"
+        self.headers = headers or {}
+
+
+class FakeChannel:
+    """Channel that records sends and fails with the queued errors first."""
+
+    def __init__(self, errors=()):
+        self.sent = []
+        self.errors = list(errors)
+
+    async def send(self, **kwargs):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append(kwargs)
+        return f"message {len(self.sent)}"
+
+
+def rate_limited():
+    return discord.HTTPException(FakeResponse(429, {"Retry-After": "0"}), "slow down")
+
+
+class TestSendQueue:
+    """Test ordering, pacing and retries."""
+
+    @pytest.mark.unit
+    def test_sends_in_order_and_returns_messages(self):
+        """Test messages are sent in order and each caller gets its message."""
+        channel = FakeChannel()
+
+        async def run():
+            queue = SendQueue(interval=0)
+            return await asyncio.gather(*(queue.send(channel, content=str(i)) for i in range(3)))
+
+        assert asyncio.run(run()) == ["message 1", "message 2", "message 3"]
+        assert [m["content"] for m in channel.sent] == ["0", "1", "2"]
+
+    @pytest.mark.unit
+    def test_sends_are_paced(self):
+        """Test consecutive sends are at least the interval apart."""
+        channel = FakeChannel()
+
+        async def run():
+            queue = SendQueue(interval=0.05)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for i in range(3):
+                await queue.send(channel, content=str(i))
+            return loop.time() - start
+
+        assert asyncio.run(run()) >= 0.1
+
+    @pytest.mark.unit
+    def test_channels_are_paced_independently(self):
+        """Test one channel's queue doesn't delay sends to another."""
+        first, second = FakeChannel(), FakeChannel()
+
+        async def run():
+            queue = SendQueue(interval=0.2)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(
+                queue.send(first, content="a"), queue.send(first, content="b"),
+                queue.send(second, content="c")
+            )
+            first_done = loop.time() - start
+            start = loop.time()
+            await queue.send(second, content="d")
+            return first_done, loop.time() - start
+
+        both, second_again = asyncio.run(run())
+        assert 0.2 <= both < 0.4
+        assert second_again < 0.2  # second channel's pause already passed
+        assert [m["content"] for m in first.sent] == ["a", "b"]
+        assert [m["content"] for m in second.sent] == ["c", "d"]
+
+    @pytest.mark.unit
+    def test_retries_after_429(self):
+        """Test a rate-limited send is retried."""
+        channel = FakeChannel(errors=[rate_limited()])
+
+        async def run():
+            return await SendQueue(interval=0).send(channel, content="hi")
+
+        assert asyncio.run(run()) == "message 1"
+
+    @pytest.mark.unit
+    def test_gives_up_after_max_attempts(self):
+        """Test persistent 429s surface to the caller."""
+        channel = FakeChannel(errors=[rate_limited() for _ in range(MAX_SEND_ATTEMPTS)])
+
+        async def run():
+            return await SendQueue(interval=0).send(channel, content="hi")
+
+        with pytest.raises(discord.HTTPException):
+            asyncio.run(run())
+
+    @pytest.mark.unit
+    def test_other_errors_are_not_retried(self):
+        """Test non-429 errors are raised to the caller and the queue keeps working."""
+        channel = FakeChannel(errors=[discord.HTTPException(FakeResponse(403), "forbidden")])
+
+        async def run():
+            queue = SendQueue(interval=0)
+            with pytest.raises(discord.HTTPException):
+                await queue.send(channel, content="a")
+            return await queue.send(channel, content="b")
+
+        assert asyncio.run(run()) == "message 1"
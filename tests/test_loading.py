@@ -82,7 +82,18 @@ class TestConstraintsLoading:
         constraints = load_constraints(str(temp_dir / "nonexistent.json"))
         assert "exempt_all" in constraints
         assert constraints["exempt_all"] == []
-    
+
+    @pytest.mark.integration
+    def test_load_constraints_defaults_not_shared(self, temp_dir):
+        """Test mutating loaded defaults doesn't leak into the next load."""
+        first = load_constraints(str(temp_dir / "nonexistent.json"))
+        first["exempt_all"].append("Alex")
+        first["brother_category_bans"]["Alex"] = ["bathrooms"]
+
+        second = load_constraints(str(temp_dir / "nonexistent.json"))
+        assert second["exempt_all"] == []
+        assert second["brother_category_bans"] == {}
+
     @pytest.mark.integration
     def test_load_constraints_validates_numeric(self, temp_dir):
         """Test loading constraints validates numeric values."""
@@ -0,0 +1,47 @@
+"""Tests for expanding task templates into occurrences."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from house_duties.scheduler import occurrences_from_templates
+from house_duties.models import TaskTemplate
+from datetime import date
+
+
+def weekly_template(key, days):
+    """A one-person weekly template on the given days."""
+    return TaskTemplate(
+        key=key,
+        label=key.title(),
+        deck="Test",
+        category="common",
+        people_needed=1,
+        cadence="weekly",
+        days_of_week=days
+    )
+
+
+class TestOccurrenceExpansion:
+    """Test templates are expanded into dated occurrences."""
+
+    @pytest.mark.unit
+    def test_occurrences_are_in_date_order(self):
+        """Test occurrences come out sorted by due date across templates and weeks."""
+        templates = [weekly_template("LATE", [5]), weekly_template("EARLY", [1, 3])]
+        anchor = date(2026, 1, 18)
+
+        occs = occurrences_from_templates(templates, anchor, 2, anchor, {}, roster_size=6)
+
+        assert [o.due_dt for o in occs] == sorted(o.due_dt for o in occs)
+        assert [o.task_key for o in occs[:3]] == ["EARLY", "EARLY", "LATE"]
+
+    @pytest.mark.unit
+    def test_out_of_range_day_names_template(self):
+        """Test a weekday outside 0-6 raises a ValueError naming the template."""
+        templates = [weekly_template("BAD_DAY", [1, 7])]
+        anchor = date(2026, 1, 18)
+
+        with pytest.raises(ValueError, match="BAD_DAY"):
+            occurrences_from_templates(templates, anchor, 1, anchor, {}, roster_size=6)
@@ -79,7 +79,34 @@ class TestStateManagement:
         
         with pytest.raises(ValueError, match="State must be a dictionary"):
             save_state(str(state_file), "not a dict")
-    
+
+    @pytest.mark.integration
+    def test_save_state_failed_write_keeps_old_file(self, sample_state_file):
+        """Test a state that can't be serialized leaves the old file and no temp files."""
+        before = sample_state_file.read_bytes()
+
+        with pytest.raises(TypeError):
+            save_state(str(sample_state_file), {"bad": object()})
+
+        assert sample_state_file.read_bytes() == before
+        assert not list(sample_state_file.parent.glob("*.tmp"))
+
+    @pytest.mark.integration
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_save_state_keeps_file_mode(self, temp_dir):
+        """Test saving state keeps an existing file's mode and honours the umask for new files."""
+        state_file = temp_dir / "state.json"
+        old_umask = os.umask(0o022)
+        try:
+            save_state(str(state_file), {"anchor_sunday": "2026-01-18"})
+            assert state_file.stat().st_mode & 0o777 == 0o644
+
+            state_file.chmod(0o640)
+            save_state(str(state_file), {"anchor_sunday": "2026-01-25"})
+            assert state_file.stat().st_mode & 0o777 == 0o640
+        finally:
+            os.umask(old_umask)
+
     @pytest.mark.unit
     def test_get_anchor_sunday_existing(self):
         """Test get_anchor_sunday with existing anchor."""
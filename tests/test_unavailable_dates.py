@@ -2,7 +2,7 @@
 import pytest
 from datetime import datetime, date
 from house_duties.models import Occurrence
-from house_duties.assignment import is_unavailable
+from house_duties.assignment import is_unavailable, assign_chores
 
 
 def test_unavailable_single_date():
@@ -205,3 +205,27 @@ def test_unavailable_invalid_date_format():
     
     # Should not raise exception, just return False
     assert is_unavailable("BadDate", occ, constraints) is False
+
+
+def test_assign_skips_unavailable_and_repeats():
+    """Test unavailable brothers are skipped and no one fills two slots of a task."""
+    constraints = {
+        "brother_unavailable_dates": {"John": ["2026-01-27"]},
+        "max_per_brother_per_day": 3
+    }
+    
+    occ = Occurrence(
+        task_key="TEST",
+        task_label="Test Task",
+        deck="Test Deck",
+        category="test",
+        people_needed=3,
+        due_dt=datetime(2026, 1, 27, 23, 59),
+        week_index=0,
+        weight=1.0
+    )
+    
+    schedule, _ = assign_chores([occ], ["John", "Jane", "Jim"], constraints, {})
+    
+    assert schedule[0]["assigned"][:2] in (["Jane", "Jim"], ["Jim", "Jane"])
+    assert schedule[0]["assigned"][2] == "UNASSIGNED"